@@ -77,7 +77,13 @@ async def main() -> None:
     ) -> None:
         # In this case, we are expecting all the paths to be directories, and are
         # ignoring permissions, ownership, etc. Just create the directories.
-        resolved_path_item.value().mkdir(exist_ok=True, parents=True)
+        #
+        # The IO function is only called for a path once its parent has been handled,
+        # so if the parent is part of the workspace, then only the path itself needs
+        # to be created. Otherwise, the parents may not exist yet.
+        resolved_path_item.create_directory(
+            parents=not resolved_path_item.parent_in_workspace()
+        )
 
     await openpathresolver.create_workspace(
         config,
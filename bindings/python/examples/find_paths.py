@@ -21,9 +21,9 @@ def main() -> None:
     expected_paths = []
 
     for index in range(3):
-        test_dir = tmp_root / "path" / "to" / f"{index:03d}" / "test_other_test"
+        test_dir = pathlib.Path(f"{tmp_root}/path/to/{index:03d}/test_other_test")
         test_dir.mkdir(parents=True, exist_ok=True)
-        expected_paths.append(test_dir)
+        expected_paths.append(str(test_dir))
 
     # First, the config will need to be initialized. openpathresolver intentionally does
     # not include support for a config file such as yaml, json, etc because we assume
@@ -55,6 +55,18 @@ def main() -> None:
     )
     assert path == pathlib.Path("path/to/003/test_other_test")
 
+    # When getting a lot of paths from the same config, the fields can be bound to the
+    # config once and then updated between calls, rather than building and converting a
+    # new dict for every call.
+    fields = openpathresolver.PathFields(config)
+    fields.set("str", "test")
+    fields.set("other", "other_test")
+
+    for index in range(3):
+        fields.set("int", index)
+        path = openpathresolver.get_path(config, "path", fields)
+        assert path == pathlib.Path(f"path/to/{index:03d}/test_other_test")
+
 
 if __name__ == "__main__":
     main()
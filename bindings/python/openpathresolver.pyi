@@ -44,6 +44,12 @@ class Owner(enum.Enum):
     Project = enum.auto()
     User = enum.auto()
 
+class PathFields:
+    def __init__(self, config: Config) -> None: ...
+    def set(self, key: str, value: PathValue) -> None: ...
+    def remove(self, key: str) -> PathValue | None: ...
+    def clear(self) -> None: ...
+
 class PathItem:
     def __init__(
         self,
@@ -65,6 +71,8 @@ class ResolvedPathItem:
     def path_type(self) -> PathType: ...
     def deferred(self) -> bool: ...
     def metadata(self) -> dict[str, MetadataValue]: ...
+    def parent_in_workspace(self) -> bool: ...
+    def create_directory(self, mode: int = 0o777, *, parents: bool = False) -> None: ...
 
 class PathType(enum.Enum):
     Directory = enum.auto()
@@ -89,7 +97,9 @@ def get_workspace(
     config: Config, path_fields: collections.abc.Mapping[str, PathValue]
 ) -> list[ResolvedPathItem]: ...
 def get_path(
-    config: Config, key: str, fields: collections.abc.Mapping[str, PathValue]
+    config: Config,
+    key: str,
+    fields: collections.abc.Mapping[str, PathValue] | PathFields,
 ) -> pathlib.Path: ...
 def get_fields(
     config: Config, key: str, path: os.PathLike | str
@@ -101,4 +111,10 @@ def get_key(
 ) -> str | None: ...
 def find_paths(
     config: Config, key: str, fields: collections.abc.Mapping[str, PathValue]
+) -> list[str]: ...
+def find_paths_raw(
+    config: Config, key: str, fields: collections.abc.Mapping[str, PathValue]
+) -> bytes: ...
+def paths_to_paths(
+    paths: collections.abc.Sequence[os.PathLike | str],
 ) -> list[pathlib.Path]: ...
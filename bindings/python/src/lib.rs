@@ -22,10 +22,12 @@ mod workspace_resolver;
 
 pub use errors::Error;
 pub(crate) use errors::to_py_result;
-pub use path_resolver::{find_paths, get_fields, get_key, get_path};
+pub use path_resolver::{
+    find_paths, find_paths_raw, get_fields, get_key, get_path, paths_to_paths,
+};
 pub use types::{
-    Config, FieldKey, IntegerResolver, MetadataValue, Owner, PathItem, PathType, PathValue,
-    Permission, ResolvedPathItem, StringResolver, TemplateValue,
+    Config, FieldKey, IntegerResolver, MetadataValue, Owner, PathFields, PathItem, PathType,
+    PathValue, Permission, ResolvedPathItem, StringResolver, TemplateValue,
 };
 pub use workspace_resolver::{create_workspace, get_workspace};
 
@@ -48,11 +50,14 @@ pub mod openpathresolver {
     // Types
     #[pymodule_export]
     use super::{
-        Config, FieldKey, IntegerResolver, Owner, PathItem, PathType, Permission, ResolvedPathItem,
-        StringResolver,
+        Config, FieldKey, IntegerResolver, Owner, PathFields, PathItem, PathType, Permission,
+        ResolvedPathItem, StringResolver,
     };
 
     // Functions
     #[pymodule_export]
-    use super::{create_workspace, find_paths, get_fields, get_key, get_path, get_workspace};
+    use super::{
+        create_workspace, find_paths, find_paths_raw, get_fields, get_key, get_path, get_workspace,
+        paths_to_paths,
+    };
 }
@@ -1,9 +1,18 @@
-use pyo3::prelude::*;
+use pyo3::{prelude::*, types::PyBytes};
 
 use crate::errors::to_py_error;
 
 type PathAttributes = std::collections::HashMap<String, crate::PathValue>;
 
+/// The fields for resolving a path, either as a dict or already bound to the config.
+#[derive(FromPyObject)]
+pub enum PathFieldsArg<'py> {
+    /// Fields that are bound to the config.
+    PathFields(PyRef<'py, crate::PathFields>),
+    /// Fields that will be converted for the call.
+    Fields(PathAttributes),
+}
+
 /// Resolve a path from a key and fields.
 ///
 /// This will get a path to find in the filesystem or save to based on the input key and fields.
@@ -11,7 +20,9 @@ type PathAttributes = std::collections::HashMap<String, crate::PathValue>;
 /// Args:
 ///     config: The config to get the path from.
 ///     key: The path item's key to generate the path from.
-///     fields: The fields used to fill the placeholders in the path.
+///     fields: The fields used to fill the placeholders in the path. This can also be a
+///         :code:`PathFields` when resolving many paths from the same config, so the fields are not
+///         converted again for every call.
 ///
 /// Example:
 ///
@@ -56,10 +67,19 @@ type PathAttributes = std::collections::HashMap<String, crate::PathValue>;
 pub fn get_path(
     config: &crate::Config,
     key: &str,
-    fields: PathAttributes,
+    fields: PathFieldsArg,
 ) -> PyResult<std::path::PathBuf> {
-    base_openpathresolver::get_path(&config.inner, key, &convert_fields_from_wrapper(fields)?)
-        .map_err(|err| to_py_error(&err))
+    match fields {
+        PathFieldsArg::PathFields(fields) => {
+            base_openpathresolver::get_path_from_fields(&config.inner, key, &fields.inner)
+        }
+        PathFieldsArg::Fields(fields) => base_openpathresolver::get_path(
+            &config.inner,
+            key,
+            &convert_fields_from_wrapper(fields)?,
+        ),
+    }
+    .map_err(|err| to_py_error(&err))
 }
 
 /// Try to extract the fields from a key and path.
@@ -197,6 +217,11 @@ pub fn get_key(
 /// of the path looks like `"{root}/publishes/{entity}/{version}"`, then the only required fields
 /// will be `root` and `entity`.
 ///
+/// The paths are returned as strings, since a search can return a lot of paths. The separators are
+/// normalized the same way as :code:`pathlib.Path`, so the strings are equal to
+/// :code:`str(pathlib.Path(path))`. Use :code:`paths_to_paths` to convert them to
+/// :code:`pathlib.Path` objects if they are needed.
+///
 /// Args:
 ///     config: The config to find the paths from.
 ///     key: The path item's key used to find the paths.
@@ -219,7 +244,7 @@ pub fn get_key(
 ///         for index in range(3):
 ///             test_dir = tmp_root / "path" / "to" / f"{index:03d}" / "test_other_test"
 ///             test_dir.mkdir(parents=True, exist_ok=True)
-///             expected_paths.append(test_dir)
+///             expected_paths.append(str(test_dir))
 ///     
 ///         config = openpathresolver.Config(
 ///             {
@@ -253,9 +278,144 @@ pub fn find_paths(
     config: &crate::Config,
     key: &str,
     fields: PathAttributes,
-) -> PyResult<Vec<std::path::PathBuf>> {
-    base_openpathresolver::find_paths(&config.inner, key, &convert_fields_from_wrapper(fields)?)
-        .map_err(|err| to_py_error(&err))
+) -> PyResult<Vec<std::ffi::OsString>> {
+    let paths = base_openpathresolver::find_paths(
+        &config.inner,
+        key,
+        &convert_fields_from_wrapper(fields)?,
+    )
+    .map_err(|err| to_py_error(&err))?;
+
+    Ok(paths
+        .iter()
+        .map(|path| normalize_path(path).into_os_string())
+        .collect())
+}
+
+/// Rebuild the path from its components, so the separators match a `pathlib.Path`.
+///
+/// The found paths are joined from the path parts and the field values, so a root value written
+/// with forward slashes on Windows would otherwise be mixed with the platform's separator.
+fn normalize_path(path: &std::path::Path) -> std::path::PathBuf {
+    path.components().collect()
+}
+
+/// Find paths from a given key and fields, returned as a single bytes object.
+///
+/// This is the same as :code:`find_paths`, but every path is written into one bytes object and
+/// followed by a null byte, instead of creating a string for every path. This is useful when a
+/// search returns a lot of paths, and the caller only needs some of them or can work with bytes.
+/// The separators are normalized the same way as :code:`find_paths`, so each path's text is
+/// :code:`str(pathlib.Path(path))`. The text is encoded the same way as :code:`os.fsencode` for
+/// paths that are valid Unicode, so :code:`os.fsdecode` will convert a path back into a string.
+///
+/// Args:
+///     config: The config to find the paths from.
+///     key: The path item's key used to find the paths.
+///     fields: The fields used to fill the placeholders. If a field is not included, then that
+///         represents finding all of the paths of that placeholder type.
+///
+/// Example:
+///
+///     .. testsetup::
+///
+///         import os
+///         import tempfile
+///         import pathlib
+///         import openpathresolver
+///
+///     .. testcode::
+///
+///         tmp_root = pathlib.Path(tempfile.mkdtemp())
+///         expected_paths = []
+///
+///         for index in range(3):
+///             test_dir = tmp_root / "path" / "to" / f"{index:03d}"
+///             test_dir.mkdir(parents=True, exist_ok=True)
+///             expected_paths.append(os.fsencode(test_dir))
+///
+///         config = openpathresolver.Config(
+///             {"int": openpathresolver.IntegerResolver(3)},
+///             [
+///                 openpathresolver.PathItem(
+///                     "path",
+///                     "{root}/path/to/{int}",
+///                     None,
+///                     openpathresolver.Permission.Inherit,
+///                     openpathresolver.Owner.Inherit,
+///                     openpathresolver.PathType.Directory,
+///                     deferred=False,
+///                     metadata={},
+///                 )
+///             ],
+///         )
+///
+///         raw_paths = openpathresolver.find_paths_raw(
+///             config, "path", {"root": tmp_root.as_posix()}
+///         )
+///
+///         assert sorted(raw_paths.split(b"\0")[:-1]) == sorted(expected_paths)
+///
+#[pyfunction]
+pub fn find_paths_raw<'py>(
+    py: Python<'py>,
+    config: &crate::Config,
+    key: &str,
+    fields: PathAttributes,
+) -> PyResult<Bound<'py, PyBytes>> {
+    let paths = base_openpathresolver::find_paths(
+        &config.inner,
+        key,
+        &convert_fields_from_wrapper(fields)?,
+    )
+    .map_err(|err| to_py_error(&err))?;
+    let paths = paths
+        .iter()
+        .map(|path| normalize_path(path))
+        .collect::<Vec<_>>();
+    let size = paths
+        .iter()
+        .map(|path| path.as_os_str().len() + 1)
+        .sum::<usize>();
+
+    PyBytes::new_with(py, size, |buf| {
+        let mut offset = 0;
+
+        for path in paths.iter() {
+            let bytes = path.as_os_str().as_encoded_bytes();
+            buf[offset..offset + bytes.len()].copy_from_slice(bytes);
+            // The buffer starts zeroed, so skipping a byte leaves the separator.
+            offset += bytes.len() + 1;
+        }
+
+        Ok(())
+    })
+}
+
+/// Convert the paths to :code:`pathlib.Path` objects.
+///
+/// This is for the paths returned by :code:`find_paths` when the caller needs
+/// :code:`pathlib.Path` objects instead of strings.
+///
+/// Args:
+///     paths: The paths to convert.
+///
+/// Example:
+///
+///     .. testsetup::
+///
+///         import pathlib
+///         import openpathresolver
+///
+///     .. testcode::
+///
+///         paths = openpathresolver.paths_to_paths(["path/to/001", "path/to/002"])
+///
+///         assert paths == [pathlib.Path("path/to/001"), pathlib.Path("path/to/002")]
+///
+#[pyfunction]
+pub fn paths_to_paths(paths: Vec<std::path::PathBuf>) -> Vec<std::path::PathBuf> {
+    paths
 }
 
 pub(crate) fn convert_fields_from_wrapper(
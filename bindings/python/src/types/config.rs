@@ -47,27 +47,48 @@ impl Config {
             }
         }
 
+        // The items can share the same metadata dict, so each dict is only converted once. The
+        // dicts are kept alive with their converted values, since the items may be created on
+        // demand and a freed dict's address could be reused by a later item's dict. Each item's
+        // arguments own their metadata, so the converted values are copied once per item, and the
+        // config builder moves them into the config.
+        let mut metadata_map: std::collections::HashMap<
+            usize,
+            (
+                Bound<'py, pyo3::types::PyDict>,
+                std::collections::HashMap<String, base_openpathresolver::MetadataValue>,
+            ),
+        > = std::collections::HashMap::new();
+
         for path_item in path_items.try_iter()? {
-            let path_item = path_item?.extract::<crate::PathItem>()?;
-            let parent = match path_item.parent {
-                Some(p) => Some(p.try_into().map_err(|err| to_py_error(&err))?),
+            let path_item = path_item?.extract::<PyRef<crate::PathItem>>()?;
+            let parent = match &path_item.parent {
+                Some(p) => Some(p.clone().try_into().map_err(|err| to_py_error(&err))?),
                 None => None,
             };
+            let metadata = path_item.metadata.bind(path_items.py());
+            let metadata = match metadata_map.entry(metadata.as_ptr() as usize) {
+                std::collections::hash_map::Entry::Occupied(entry) => entry.get().1.clone(),
+                std::collections::hash_map::Entry::Vacant(entry) => {
+                    let values = metadata
+                        .extract::<std::collections::HashMap<String, crate::MetadataValue>>()?
+                        .into_iter()
+                        .map(|(k, v)| (k, v.inner))
+                        .collect();
+                    entry.insert((metadata.clone(), values)).1.clone()
+                }
+            };
 
             builder = builder
                 .add_path_item(base_openpathresolver::PathItemArgs {
-                    key: path_item.key.inner,
-                    path: path_item.path,
+                    key: path_item.key.inner.clone(),
+                    path: path_item.path.clone(),
                     parent,
                     permission: path_item.permission.into(),
                     owner: path_item.owner.into(),
                     path_type: path_item.path_type.into(),
                     deferred: path_item.deferred,
-                    metadata: path_item
-                        .metadata
-                        .into_iter()
-                        .map(|(k, v)| (k, v.inner))
-                        .collect(),
+                    metadata,
                 })
                 .map_err(|err| to_py_error(&err))?;
         }
@@ -1,11 +1,13 @@
 mod config;
 mod field_key;
+mod path_fields;
 mod path_item;
 mod resolver;
 mod value;
 
 pub use config::Config;
 pub use field_key::FieldKey;
+pub use path_fields::PathFields;
 pub use path_item::{Owner, PathItem, PathType, Permission, ResolvedPathItem};
 pub use resolver::{IntegerResolver, StringResolver};
 pub use value::{MetadataValue, PathValue, TemplateValue};
@@ -0,0 +1,59 @@
+use pyo3::prelude::*;
+
+/// Path fields that are bound to a config.
+///
+/// This is an alternative to the fields dict for resolving many paths from the same config. The
+/// values are stored by the config's placeholders when they are set, so resolving a path does not
+/// need to convert the fields again. The fields can be reused between calls by updating or
+/// clearing them.
+///
+/// Fields that are not used by any of the config's paths are ignored.
+///
+/// Args:
+///     config: The config to bind the fields to.
+#[derive(Clone)]
+#[pyclass]
+pub struct PathFields {
+    pub(crate) inner: base_openpathresolver::PathFields,
+}
+
+impl std::fmt::Debug for PathFields {
+    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+        self.inner.fmt(f)
+    }
+}
+
+#[pymethods]
+impl PathFields {
+    #[new]
+    fn new(config: &crate::Config) -> Self {
+        Self {
+            inner: base_openpathresolver::PathFields::new(&config.inner),
+        }
+    }
+
+    /// Set the value of a field.
+    ///
+    /// Args:
+    ///     key: The field's key.
+    ///     value: The value to fill the placeholders with.
+    pub fn set(&mut self, key: &str, value: crate::PathValue) -> PyResult<()> {
+        crate::to_py_result(self.inner.set(key, value.inner))
+    }
+
+    /// Remove the value of a field.
+    ///
+    /// Args:
+    ///     key: The field's key.
+    ///
+    /// Returns:
+    ///     The removed value, if the field was set.
+    pub fn remove(&mut self, key: &str) -> PyResult<Option<crate::PathValue>> {
+        Ok(crate::to_py_result(self.inner.remove(key))?.map(crate::PathValue::from))
+    }
+
+    /// Remove all of the values.
+    pub fn clear(&mut self) {
+        self.inner.clear()
+    }
+}
@@ -194,10 +194,48 @@ impl ResolvedPathItem {
             .map(|(k, v)| (k.clone(), crate::MetadataValue::from(v.clone())))
             .collect()
     }
+
+    /// Whether the parent path is also part of the same workspace.
+    ///
+    /// The :code:`create_workspace` function will only call the IO function for a path after its
+    /// parent path has been handled. So if this is true, then the IO function can create the path
+    /// directly without first checking for or creating the parent paths.
+    pub fn parent_in_workspace(&self) -> bool {
+        self.inner.parent_in_workspace()
+    }
+
+    /// Create the path as a directory.
+    ///
+    /// This creates the directory directly from the resolved path, without going through
+    /// :code:`pathlib`. It is not an error if the directory already exists.
+    ///
+    /// Args:
+    ///     mode: The permission bits of the new directory, before the umask is applied. This is the
+    ///         same default as :code:`os.mkdir`, and is ignored on platforms other than Unix.
+    ///     parents: Whether to create the missing parent directories as well.
+    #[pyo3(signature = (mode=0o777, *, parents=false))]
+    pub fn create_directory(&self, py: Python<'_>, mode: u32, parents: bool) -> PyResult<()> {
+        let path = self.inner.value();
+        let mut builder = std::fs::DirBuilder::new();
+        builder.recursive(parents);
+
+        #[cfg(unix)]
+        std::os::unix::fs::DirBuilderExt::mode(&mut builder, mode);
+        #[cfg(not(unix))]
+        let _ = mode;
+
+        // The IO functions are async, so release the GIL while waiting on the filesystem.
+        let result = py.detach(|| match builder.create(path) {
+            Err(err) if err.kind() == std::io::ErrorKind::AlreadyExists && path.is_dir() => Ok(()),
+            result => result,
+        });
+
+        Ok(result?)
+    }
 }
 
 /// Input path item arguments.
-#[derive(Debug, Clone)]
+#[derive(Debug)]
 #[pyclass]
 pub struct PathItem {
     pub(crate) key: crate::FieldKey,
@@ -207,7 +245,8 @@ pub struct PathItem {
     pub(crate) owner: Owner,
     pub(crate) path_type: PathType,
     pub(crate) deferred: bool,
-    pub(crate) metadata: std::collections::HashMap<String, crate::MetadataValue>,
+    // Kept as the caller's dict, and only converted when the config is built.
+    pub(crate) metadata: Py<pyo3::types::PyDict>,
 }
 
 #[pymethods]
@@ -231,7 +270,8 @@ impl PathItem {
     ///         current path to `path/to/{thing}/some/{subthing}`, and both thing and subthing are
     ///         valid, then the path will be resolved.
     ///     metadata: Extra metadata for the arguments that may be useful, as as marking a path as
-    ///     belonging to a specific user.
+    ///     belonging to a specific user. The dict is not copied, so items can share the same
+    ///     metadata. The values are checked when the config is built.
     #[allow(clippy::too_many_arguments)]
     #[new]
     fn new(
@@ -242,7 +282,7 @@ impl PathItem {
         owner: Owner,
         path_type: PathType,
         deferred: bool,
-        metadata: std::collections::HashMap<String, crate::MetadataValue>,
+        metadata: Py<pyo3::types::PyDict>,
     ) -> PyResult<Self> {
         let key = crate::FieldKey::try_from(key)?;
 
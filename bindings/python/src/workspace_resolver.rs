@@ -17,7 +17,9 @@ type TemplateAttributes = std::collections::HashMap<String, crate::TemplateValue
 ///         placeholder that does not include a field, then the path will not be built.
 ///     template_fields: The fields used to fill file templates with.
 ///     io_function: This function is responsible for actually creating the workspace and defining
-///         the rules of the workspace based on the config.
+///         the rules of the workspace based on the config. Every call receives its own shallow
+///         copy of the template fields, so the nested lists and dicts are shared between the calls
+///         and with the caller.
 ///
 /// Example:
 ///
@@ -82,20 +84,29 @@ pub fn create_workspace<'py>(
     py: Python<'py>,
     config: crate::Config,
     path_fields: PathAttributes,
-    template_fields: TemplateAttributes,
+    template_fields: Bound<'py, pyo3::types::PyDict>,
     io_function: Py<PyAny>,
 ) -> PyResult<Bound<'py, PyAny>> {
     let path_fields = crate::path_resolver::convert_fields_from_wrapper(path_fields)?;
-    let template_fields = convert_fields_from_wrapper(template_fields)?;
-
-    struct CreateWorkspaceIoFunctionWrapper(Py<PyAny>, pyo3_async_runtimes::TaskLocals);
+    // The IO function calls get the template fields from the caller's dict rather than converting
+    // them back from the base fields for every path. The dict is copied so later changes from the
+    // caller are not seen by the calls.
+    let py_template_fields = template_fields.copy()?.unbind();
+    let template_fields =
+        convert_fields_from_wrapper(template_fields.extract::<TemplateAttributes>()?)?;
+
+    struct CreateWorkspaceIoFunctionWrapper(
+        Py<PyAny>,
+        Py<pyo3::types::PyDict>,
+        pyo3_async_runtimes::TaskLocals,
+    );
 
     #[async_trait::async_trait]
     impl base_openpathresolver::CreateWorkspaceIoFunction for CreateWorkspaceIoFunctionWrapper {
         async fn call(
             &self,
             config: std::sync::Arc<base_openpathresolver::Config>,
-            template_fields: std::sync::Arc<
+            _template_fields: std::sync::Arc<
                 std::collections::HashMap<
                     base_openpathresolver::FieldKey,
                     base_openpathresolver::TemplateValue,
@@ -103,22 +114,19 @@ pub fn create_workspace<'py>(
             >,
             path_item: base_openpathresolver::ResolvedPathItem,
         ) -> Result<(), base_openpathresolver::Error> {
-            // TODO: This is probably not efficient. Could probably get the values straight from
-            // the create_workspace args.
-            let template_fields = std::sync::Arc::unwrap_or_clone(template_fields);
-            let template_fields = convert_fields_from_base(template_fields)
-                .map_err(|err| base_openpathresolver::Error::new(err.to_string()))?;
             Python::attach(|py| -> PyResult<_> {
                 let awaitable = self.0.call(
                     py,
                     (
                         crate::Config { inner: config },
-                        template_fields,
+                        // Each call gets its own copy, so one call changing the fields does not
+                        // change them for the other calls.
+                        self.1.bind(py).copy()?,
                         crate::ResolvedPathItem { inner: path_item },
                     ),
                     None,
                 )?;
-                pyo3_async_runtimes::into_future_with_locals(&self.1, awaitable.bind(py).clone())
+                pyo3_async_runtimes::into_future_with_locals(&self.2, awaitable.bind(py).clone())
             })
             .map_err(|err| base_openpathresolver::Error::new(err.to_string()))?
             .await
@@ -134,7 +142,7 @@ pub fn create_workspace<'py>(
             config.inner.clone(),
             &path_fields,
             std::sync::Arc::new(template_fields),
-            CreateWorkspaceIoFunctionWrapper(io_function, task_locals),
+            CreateWorkspaceIoFunctionWrapper(io_function, py_template_fields, task_locals),
         )
         .await
         .map_err(|err| to_py_error(&err))
@@ -231,21 +239,3 @@ pub(crate) fn convert_fields_from_wrapper(
 
     Ok(converted_fields)
 }
-
-pub(crate) fn convert_fields_from_base(
-    fields: std::collections::HashMap<
-        base_openpathresolver::FieldKey,
-        base_openpathresolver::TemplateValue,
-    >,
-) -> PyResult<std::collections::HashMap<crate::FieldKey, crate::TemplateValue>> {
-    let mut converted_fields = std::collections::HashMap::with_capacity(fields.len());
-
-    for (key, value) in fields {
-        let key = crate::FieldKey::try_from(key)?;
-        let value = crate::TemplateValue::from(value);
-
-        converted_fields.insert(key, value);
-    }
-
-    Ok(converted_fields)
-}
@@ -1,12 +1,11 @@
 from __future__ import annotations
 
+import os
 import pathlib
-from typing import TYPE_CHECKING
 
-import openpathresolver
+import pytest
 
-if TYPE_CHECKING:
-    import pytest
+import openpathresolver
 
 
 def test_get_path_success() -> None:
@@ -41,6 +40,69 @@ def test_get_path_success() -> None:
     assert path == pathlib.Path("path/to/003/test_other_test")
 
 
+def test_get_path_path_fields_success() -> None:
+    config = openpathresolver.Config(
+        {
+            "int": openpathresolver.IntegerResolver(3),
+            "str": openpathresolver.StringResolver(r"\w+"),
+        },
+        [
+            openpathresolver.PathItem(
+                "path",
+                "path/to/{int}/{str}_{other}",
+                None,
+                openpathresolver.Permission.Inherit,
+                openpathresolver.Owner.Inherit,
+                openpathresolver.PathType.Directory,
+                deferred=False,
+                metadata={},
+            )
+        ],
+    )
+    fields = openpathresolver.PathFields(config)
+    fields.set("str", "test")
+    fields.set("other", "other_test")
+    fields.set("unused", "unused")
+
+    for index in range(3):
+        fields.set("int", index)
+        path = openpathresolver.get_path(config, "path", fields)
+
+        assert path == pathlib.Path(f"path/to/{index:03d}/test_other_test")
+
+    assert fields.remove("int") == 2  # noqa: PLR2004
+    assert fields.remove("unused") is None
+
+    with pytest.raises(openpathresolver.Error):
+        openpathresolver.get_path(config, "path", fields)
+
+    fields.clear()
+
+    assert fields.remove("str") is None
+
+
+def test_get_path_path_fields_failure_different_config() -> None:
+    path_items = [
+        openpathresolver.PathItem(
+            "path",
+            "path/to/{thing}",
+            None,
+            openpathresolver.Permission.Inherit,
+            openpathresolver.Owner.Inherit,
+            openpathresolver.PathType.Directory,
+            deferred=False,
+            metadata={},
+        )
+    ]
+    config = openpathresolver.Config({}, path_items)
+    other_config = openpathresolver.Config({}, path_items)
+    fields = openpathresolver.PathFields(other_config)
+    fields.set("thing", "value")
+
+    with pytest.raises(openpathresolver.Error):
+        openpathresolver.get_path(config, "path", fields)
+
+
 def test_get_fields_success() -> None:
     config = openpathresolver.Config(
         {
@@ -108,9 +170,9 @@ def test_find_paths_success(tmp_path_factory: pytest.TempPathFactory) -> None:
     expected_paths = []
 
     for index in range(3):
-        test_dir = tmp_root / "path" / "to" / f"{index:03d}" / "test_other_test"
+        test_dir = pathlib.Path(f"{tmp_root}/path/to/{index:03d}/test_other_test")
         test_dir.mkdir(parents=True, exist_ok=True)
-        expected_paths.append(test_dir)
+        expected_paths.append(str(test_dir))
 
     config = openpathresolver.Config(
         {
@@ -138,3 +200,58 @@ def test_find_paths_success(tmp_path_factory: pytest.TempPathFactory) -> None:
     )
 
     assert sorted(paths) == sorted(expected_paths)
+
+
+def test_find_paths_raw_success(tmp_path_factory: pytest.TempPathFactory) -> None:
+    tmp_root = tmp_path_factory.mktemp("root")
+    expected_paths = []
+
+    for index in range(3):
+        test_dir = pathlib.Path(f"{tmp_root}/path/to/{index:03d}/test_other_test")
+        test_dir.mkdir(parents=True, exist_ok=True)
+        expected_paths.append(os.fsencode(test_dir))
+
+    config = openpathresolver.Config(
+        {
+            "int": openpathresolver.IntegerResolver(3),
+            "str": openpathresolver.StringResolver(r"\w+"),
+        },
+        [
+            openpathresolver.PathItem(
+                "path",
+                "{root}/path/to/{int}/{str}_{other}",
+                None,
+                openpathresolver.Permission.Inherit,
+                openpathresolver.Owner.Inherit,
+                openpathresolver.PathType.Directory,
+                deferred=False,
+                metadata={},
+            )
+        ],
+    )
+
+    raw_paths = openpathresolver.find_paths_raw(
+        config,
+        "path",
+        {"root": tmp_root.as_posix(), "str": "test", "other": "other_test"},
+    )
+
+    assert raw_paths.endswith(b"\0")
+    assert sorted(raw_paths.split(b"\0")[:-1]) == sorted(expected_paths)
+
+    raw_paths = openpathresolver.find_paths_raw(
+        config,
+        "path",
+        {"root": tmp_root.as_posix(), "str": "missing", "other": "other_test"},
+    )
+
+    assert raw_paths == b""
+
+
+def test_paths_to_paths_success(tmp_path_factory: pytest.TempPathFactory) -> None:
+    tmp_root = tmp_path_factory.mktemp("root")
+    paths = [f"{tmp_root}/path/to/{index:03d}" for index in range(3)]
+
+    result = openpathresolver.paths_to_paths(paths)
+
+    assert result == [pathlib.Path(path) for path in paths]
@@ -44,7 +44,7 @@ async def test_create_workspace_success(
         template_args: collections.abc.Mapping[str, openpathresolver.TemplateValue],  # noqa: ARG001
         resolved_path_item: openpathresolver.ResolvedPathItem,
     ) -> None:
-        resolved_path_item.value().mkdir(exist_ok=True, parents=True)
+        resolved_path_item.create_directory(parents=True)
 
         if resolved_path_item.key() == "path":
             assert resolved_path_item.metadata()["test"] == 123  # noqa: PLR2004
@@ -59,6 +59,106 @@ async def test_create_workspace_success(
     assert (tmp_root / "path" / "to" / "003" / "test_other_test").is_dir()
 
 
+@pytest.mark.asyncio
+async def test_create_workspace_template_fields_copied_success(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> None:
+    tmp_root = tmp_path_factory.mktemp("root")
+
+    config = openpathresolver.Config(
+        {},
+        [
+            openpathresolver.PathItem(
+                "path",
+                "{root}/path/to",
+                None,
+                openpathresolver.Permission.Inherit,
+                openpathresolver.Owner.Inherit,
+                openpathresolver.PathType.Directory,
+                deferred=False,
+                metadata={},
+            )
+        ],
+    )
+    template_fields = {"test": "value"}
+    seen_fields = []
+
+    async def io_function(
+        config: openpathresolver.Config,  # noqa: ARG001
+        template_args: collections.abc.Mapping[str, openpathresolver.TemplateValue],
+        resolved_path_item: openpathresolver.ResolvedPathItem,  # noqa: ARG001
+    ) -> None:
+        assert isinstance(template_args, dict)
+        seen_fields.append(dict(template_args))
+        # Each call gets its own dict, so this does not change the other calls' fields.
+        template_args["test"] = "changed"
+
+    await openpathresolver.create_workspace(
+        config,
+        {"root": tmp_root.as_posix()},
+        template_fields,
+        io_function,
+    )
+
+    assert len(seen_fields) > 1
+    assert all(fields == {"test": "value"} for fields in seen_fields)
+    assert template_fields == {"test": "value"}
+
+
+@pytest.mark.asyncio
+async def test_create_workspace_siblings_concurrent_success(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> None:
+    tmp_root = tmp_path_factory.mktemp("root")
+
+    config = openpathresolver.Config(
+        {},
+        [
+            openpathresolver.PathItem(
+                key,
+                f"{{root}}/{key}",
+                None,
+                openpathresolver.Permission.Inherit,
+                openpathresolver.Owner.Inherit,
+                openpathresolver.PathType.Directory,
+                deferred=False,
+                metadata={},
+            )
+            for key in ("a", "b", "c")
+        ],
+    )
+    started: set[str] = set()
+    all_started = asyncio.Event()
+
+    async def io_function(
+        config: openpathresolver.Config,  # noqa: ARG001
+        template_args: collections.abc.Mapping[str, openpathresolver.TemplateValue],  # noqa: ARG001
+        resolved_path_item: openpathresolver.ResolvedPathItem,
+    ) -> None:
+        key = resolved_path_item.key()
+
+        if key is None:
+            return
+
+        # Each sibling waits for the others, so this only finishes if they are all
+        # running at the same time.
+        started.add(key)
+
+        if len(started) == 3:  # noqa: PLR2004
+            all_started.set()
+
+        await asyncio.wait_for(all_started.wait(), timeout=5)
+
+    await openpathresolver.create_workspace(
+        config,
+        {"root": tmp_root.as_posix()},
+        {},
+        io_function,
+    )
+
+    assert started == {"a", "b", "c"}
+
+
 def test_create_workspace_asyncio_run_success(
     tmp_path_factory: pytest.TempPathFactory,
 ) -> None:
@@ -88,7 +188,7 @@ def test_create_workspace_asyncio_run_success(
         template_args: collections.abc.Mapping[str, openpathresolver.TemplateValue],  # noqa: ARG001
         resolved_path_item: openpathresolver.ResolvedPathItem,
     ) -> None:
-        resolved_path_item.value().mkdir(exist_ok=True, parents=True)
+        resolved_path_item.create_directory(parents=True)
 
     async def main() -> None:
         await openpathresolver.create_workspace(
@@ -162,6 +262,155 @@ def test_get_workspace_success(
     assert expected == sorted([i.value() for i in result])
 
 
+def test_get_workspace_shared_metadata_success(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> None:
+    tmp_root = tmp_path_factory.mktemp("root")
+    metadata = {"owner": "test", "tags": ["a", "b"]}
+
+    config = openpathresolver.Config(
+        {},
+        [
+            openpathresolver.PathItem(
+                key,
+                f"{{root}}/{key}",
+                None,
+                openpathresolver.Permission.Inherit,
+                openpathresolver.Owner.Inherit,
+                openpathresolver.PathType.Directory,
+                deferred=False,
+                metadata=metadata,
+            )
+            for key in ["one", "two"]
+        ],
+    )
+
+    result = openpathresolver.get_workspace(config, {"root": tmp_root.as_posix()})
+    result_metadata = {i.key(): i.metadata() for i in result if i.key() is not None}
+
+    assert result_metadata == {"one": metadata, "two": metadata}
+
+
+def test_get_workspace_generated_metadata_success(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> None:
+    tmp_root = tmp_path_factory.mktemp("root")
+    keys = [f"key_{index}" for index in range(20)]
+
+    # The items and their metadata dicts are created on demand, so a dict can be freed
+    # before the next one is created.
+    config = openpathresolver.Config(
+        {},
+        (
+            openpathresolver.PathItem(
+                key,
+                f"{{root}}/{key}",
+                None,
+                openpathresolver.Permission.Inherit,
+                openpathresolver.Owner.Inherit,
+                openpathresolver.PathType.Directory,
+                deferred=False,
+                metadata={"key": key},
+            )
+            for key in keys
+        ),
+    )
+
+    result = openpathresolver.get_workspace(config, {"root": tmp_root.as_posix()})
+    result_metadata = {i.key(): i.metadata() for i in result if i.key() is not None}
+
+    assert result_metadata == {key: {"key": key} for key in keys}
+
+
+def test_config_failure_wrong_metadata_type() -> None:
+    path_item = openpathresolver.PathItem(
+        "path",
+        "{root}/path",
+        None,
+        openpathresolver.Permission.Inherit,
+        openpathresolver.Owner.Inherit,
+        openpathresolver.PathType.Directory,
+        deferred=False,
+        metadata={"test": object()},
+    )
+
+    with pytest.raises(TypeError):
+        openpathresolver.Config({}, [path_item])
+
+
+def test_get_workspace_parent_in_workspace_success(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> None:
+    tmp_root = tmp_path_factory.mktemp("root")
+
+    config = openpathresolver.Config(
+        {},
+        [
+            openpathresolver.PathItem(
+                "path",
+                "{root}/path/to/{str}",
+                None,
+                openpathresolver.Permission.Inherit,
+                openpathresolver.Owner.Inherit,
+                openpathresolver.PathType.Directory,
+                deferred=False,
+                metadata={},
+            )
+        ],
+    )
+
+    result = openpathresolver.get_workspace(
+        config,
+        {"root": tmp_root.as_posix(), "str": "test"},
+    )
+    expected = sorted(
+        [
+            (tmp_root, False),
+            (tmp_root / "path", True),
+            (tmp_root / "path" / "to", True),
+            (tmp_root / "path" / "to" / "test", True),
+        ]
+    )
+    assert expected == sorted([(i.value(), i.parent_in_workspace()) for i in result])
+
+
+def test_resolved_path_item_create_directory_success(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> None:
+    tmp_root = tmp_path_factory.mktemp("root")
+
+    config = openpathresolver.Config(
+        {},
+        [
+            openpathresolver.PathItem(
+                "path",
+                "{root}/path/to/{str}",
+                None,
+                openpathresolver.Permission.Inherit,
+                openpathresolver.Owner.Inherit,
+                openpathresolver.PathType.Directory,
+                deferred=False,
+                metadata={},
+            )
+        ],
+    )
+
+    result = openpathresolver.get_workspace(
+        config,
+        {"root": tmp_root.as_posix(), "str": "test"},
+    )
+    leaf = next(i for i in result if i.key() == "path")
+
+    with pytest.raises(FileNotFoundError):
+        leaf.create_directory()
+
+    leaf.create_directory(parents=True)
+    assert (tmp_root / "path" / "to" / "test").is_dir()
+
+    # The directory already existing is not an error.
+    leaf.create_directory()
+
+
 def test_create_workspace_regression_segfault(
     tmp_path_factory: pytest.TempPathFactory,
 ) -> None:
@@ -155,7 +155,20 @@ async fn main() {
         ) -> Result<(), openpathresolver::Error> {
             // In this case, we are expecting all the paths to be directories, and are ignoring
             // permissions, ownership, etc. Just create the directories.
-            std::fs::create_dir_all(path_item.value())?;
+            //
+            // The IO function is only called for a path once its parent has been handled, so if
+            // the parent is part of the workspace, then only the path itself needs to be created.
+            // Otherwise, the parents may not exist yet.
+            if path_item.parent_in_workspace() {
+                match std::fs::create_dir(path_item.value()) {
+                    Ok(_) => (),
+                    Err(err) if err.kind() == std::io::ErrorKind::AlreadyExists => (),
+                    Err(err) => return Err(err.into()),
+                }
+            } else {
+                std::fs::create_dir_all(path_item.value())?;
+            }
+
             Ok(())
         }
     }
@@ -22,3 +22,63 @@ pub(crate) fn regex(pattern: &str) -> Result<std::sync::Arc<regex::Regex>, crate
         .map(|regex| regex.clone())
         .map_err(|err| crate::Error::new(format!("Regex compile error: {err}")))
 }
+
+type WorkspaceCacheKey = Vec<Option<crate::PathValue>>;
+
+/// Cache the workspaces resolved from a config.
+///
+/// A config cannot change after it is built, so the workspace resolved from the same path values
+/// is always the same, and the cached workspaces never need to be invalidated.
+pub(crate) struct WorkspaceCache {
+    cache: std::sync::Mutex<
+        cached::SizedCache<WorkspaceCacheKey, std::sync::Arc<[crate::ResolvedPathItem]>>,
+    >,
+}
+
+impl WorkspaceCache {
+    pub(crate) fn new() -> Self {
+        Self {
+            cache: std::sync::Mutex::new(cached::SizedCache::with_size(256)),
+        }
+    }
+
+    /// Get the cached workspace for the path values, or resolve and cache it.
+    ///
+    /// The workspace is shared with the cache, so getting a cached workspace does not copy it.
+    /// Errors are not cached.
+    pub(crate) fn get_or_try_insert_with(
+        &self,
+        values: &crate::types::FieldValues,
+        resolve: impl FnOnce() -> Result<Vec<crate::ResolvedPathItem>, crate::Error>,
+    ) -> Result<std::sync::Arc<[crate::ResolvedPathItem]>, crate::Error> {
+        let key = values
+            .iter()
+            .map(|value| value.cloned())
+            .collect::<WorkspaceCacheKey>();
+        let cached_items = self
+            .cache
+            .lock()
+            .map_err(|_| crate::Error::new("Mutex lock error"))?
+            .cache_get(&key)
+            .cloned();
+
+        if let Some(items) = cached_items {
+            return Ok(items);
+        }
+
+        // The lock is not held while resolving, so other calls are not blocked by it.
+        let items: std::sync::Arc<[crate::ResolvedPathItem]> = resolve()?.into();
+        self.cache
+            .lock()
+            .map_err(|_| crate::Error::new("Mutex lock error"))?
+            .cache_set(key, items.clone());
+
+        Ok(items)
+    }
+}
+
+impl std::fmt::Debug for WorkspaceCache {
+    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+        f.debug_struct("WorkspaceCache").finish_non_exhaustive()
+    }
+}
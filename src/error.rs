@@ -26,8 +26,6 @@ impl_from!(
     Error: std::num::TryFromIntError => "Error while converting integer type.",
     Error: std::num::ParseIntError => "Error while parsing integer.",
     Error: std::io::Error => "IO Error.",
-    Error: glob::GlobError => "Glob Error.",
-    Error: glob::PatternError => "Glob Pattern Error.",
     Error: tokio::task::JoinError => "Task Join Error.",
 );
 
@@ -21,9 +21,9 @@ mod workspace_resolver;
 
 pub use error::Error;
 pub use types::{
-    Config, ConfigBuilder, FieldKey, MetadataValue, Owner, PathItemArgs, PathType, PathValue,
-    Permission, ResolvedPathItem, Resolver, TemplateValue,
+    Config, ConfigBuilder, FieldKey, MetadataValue, Owner, PathFields, PathItemArgs, PathType,
+    PathValue, Permission, ResolvedPathItem, Resolver, TemplateValue,
 };
 
-pub use path_resolver::{find_paths, get_fields, get_key, get_path};
+pub use path_resolver::{find_paths, get_fields, get_key, get_path, get_path_from_fields};
 pub use workspace_resolver::{CreateWorkspaceIoFunction, create_workspace, get_workspace};
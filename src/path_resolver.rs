@@ -45,8 +45,37 @@ pub fn get_path(
     fields: &crate::types::PathAttributes,
 ) -> Result<std::path::PathBuf, crate::Error> {
     let key = key.try_into()?;
-    let item = match config.get_item(&key) {
-        Some(item) => item,
+
+    draw_path(config, &key, &config.field_index.values(fields))
+}
+
+/// Resolve a path from a key and path fields.
+///
+/// This is the same as [get_path], but with fields that have already been bound to the config. See
+/// [PathFields](crate::PathFields) for more information.
+///
+/// # Errors
+///
+/// - The key needs to be in the input config struct.
+/// - The fields need to be created from the input config struct.
+/// - The path variables need to be a subset of the fields.
+pub fn get_path_from_fields(
+    config: &crate::Config,
+    key: impl TryInto<crate::FieldKey, Error = crate::Error>,
+    fields: &crate::PathFields,
+) -> Result<std::path::PathBuf, crate::Error> {
+    let key = key.try_into()?;
+
+    draw_path(config, &key, &fields.values(config)?)
+}
+
+fn draw_path(
+    config: &crate::Config,
+    key: &crate::FieldKey,
+    values: &crate::types::FieldValues,
+) -> Result<std::path::PathBuf, crate::Error> {
+    let program = match config.path_programs.get(key) {
+        Some(program) => program,
         None => {
             return Err(crate::Error::new(format!(
                 "Could not find path from key: {key}"
@@ -54,16 +83,7 @@ pub fn get_path(
         }
     };
 
-    let mut path = std::path::PathBuf::new();
-    let mut path_part = String::new();
-
-    for part in item.iter() {
-        part.path.draw(&mut path_part, fields, &config.resolvers)?;
-        path.push(path_part.as_str());
-        path_part.clear();
-    }
-
-    Ok(path)
+    program.draw(&config.items, values, &config.field_index)
 }
 
 /// Try to extract the fields from a key and path.
@@ -123,18 +143,11 @@ pub fn get_fields(
             )));
         }
     };
-    let mut part_pattern = String::new();
     let mut fields = crate::types::PathAttributes::new();
 
     for (part, path_part) in item.iter().zip(path.iter()) {
-        part_pattern.clear();
-        part_pattern.push('^');
-        part.path
-            .draw_regex_pattern(&mut part_pattern, &config.resolvers)?;
-        part_pattern.push('$');
-        let regex_pattern = crate::cache::regex(&part_pattern)?;
         let path_part_str = path_part.to_string_lossy();
-        let captures = match regex_pattern.captures(&path_part_str) {
+        let captures = match part.pattern.captures(&path_part_str) {
             Some(captures) => captures,
             None => return Ok(None),
         };
@@ -198,13 +211,38 @@ pub fn get_key<'a>(
     fields: &crate::types::PathAttributes,
 ) -> Result<Option<&'a crate::FieldKey>, crate::Error> {
     let path = path.as_ref();
+    let values = config.field_index.values(fields);
+    let can_skip_branches = config.item_tree.can_skip_branches(&values);
+    let mut stack: Vec<(usize, std::path::PathBuf)> = config
+        .item_tree
+        .roots
+        .iter()
+        .map(|index| (*index, std::path::PathBuf::new()))
+        .collect();
+    let mut path_part = String::new();
 
-    for (key, _) in config.item_map.iter() {
-        let other_path = get_path(config, key, fields)?;
+    // Walk the items from the roots down, so the parts shared by several keys are only drawn
+    // once, and skip the branches that cannot lead to the path.
+    while let Some((index, parent_path)) = stack.pop() {
+        let item = &config.items[index];
+        item.render
+            .draw(&mut path_part, &values, &config.field_index)?;
+        let item_path = parent_path.join(path_part.as_str());
+        path_part.clear();
 
-        if path == other_path {
+        if can_skip_branches && !path.starts_with(&item_path) {
+            continue;
+        }
+
+        if path == item_path
+            && let Some(key) = &config.item_tree.keys[index]
+        {
             return Ok(Some(key));
         }
+
+        for child_index in config.item_tree.children[index].iter().rev() {
+            stack.push((*child_index, item_path.clone()));
+        }
     }
 
     Ok(None)
@@ -262,41 +300,83 @@ pub fn find_paths(
         }
     };
 
-    let mut regex_pattern = String::new();
-    let mut glob_path = std::path::PathBuf::new();
-
-    regex_pattern.push('^');
+    let compiled_regex = match config.path_patterns.get(&key) {
+        Some(compiled_regex) => compiled_regex,
+        None => {
+            return Err(crate::Error::new(format!(
+                "Could not find paths from key: {key}"
+            )));
+        }
+    };
+    let values = config.field_index.values(fields);
+    let mut level_paths = vec![std::path::PathBuf::new()];
+    // Whether the paths in the current level are known to exist. The resolved parts are joined
+    // without touching the filesystem, and are checked when the next level is read.
+    let mut level_paths_exist = true;
+    let mut path_part = String::new();
 
+    // Search the paths one level at a time, so only the levels with unresolved placeholders read
+    // the filesystem, and each directory is read once.
     for (index, part) in item.iter().enumerate() {
-        let mut regex_part = String::new();
-        part.path
-            .draw_regex_pattern(&mut regex_part, &config.resolvers)?;
+        if part.render.is_resolved_by(&values) {
+            part.render
+                .draw(&mut path_part, &values, &config.field_index)?;
 
-        let value = if part.path.has_variable_tokens() {
-            part.path.try_to_literal_token(fields, &config.resolvers)?
-        } else {
-            part.path.clone()
-        };
-
-        let mut glob_part = String::new();
-        value.draw_glob_pattern(&mut glob_part)?;
+            for path in level_paths.iter_mut() {
+                path.push(path_part.as_str());
+            }
 
-        regex_pattern.push_str(&regex_part);
+            path_part.clear();
+            level_paths_exist = false;
+            continue;
+        }
 
-        if index != item.len() - 1 && !regex_pattern.ends_with(r"[\\/]") {
-            regex_pattern.push_str(r"[\\/]");
+        // A single regex for each level checks both the available field values and the shape of
+        // the missing ones, so each entry is only matched once. The available values can contain
+        // separators, so the part can cover several levels.
+        let part_levels = part
+            .render
+            .compile_regex_levels(&values, &config.field_index)?;
+        let is_last_part = index == item.len() - 1;
+
+        for (level_index, part_level) in part_levels.iter().enumerate() {
+            let pattern = match part_level {
+                crate::types::PartLevel::Literal(literal) => {
+                    for path in level_paths.iter_mut() {
+                        path.push(literal);
+                    }
+
+                    level_paths_exist = false;
+                    continue;
+                }
+                crate::types::PartLevel::Pattern(pattern) => pattern,
+            };
+            let is_last_level = is_last_part && level_index == part_levels.len() - 1;
+
+            level_paths = if level_paths.len() > PARALLEL_SCAN_THRESHOLD {
+                scan_directories_parallel(&level_paths, pattern, is_last_level)?
+            } else {
+                scan_directories(&level_paths, pattern, is_last_level)?
+            };
+            level_paths_exist = true;
+
+            if level_paths.is_empty() {
+                break;
+            }
         }
 
-        glob_path.push(glob_part);
+        if level_paths.is_empty() {
+            break;
+        }
     }
 
-    regex_pattern.push('$');
-
-    let compiled_regex = regex::Regex::new(&regex_pattern)?;
-    let mut out_paths = Vec::new();
+    // The last level is an upper bound on the number of paths found.
+    let mut out_paths = Vec::with_capacity(level_paths.len());
 
-    for result in glob::glob(glob_path.to_string_lossy().as_ref())? {
-        let path = result?;
+    for path in level_paths {
+        if !level_paths_exist && !path.try_exists()? {
+            continue;
+        }
 
         if compiled_regex.is_match(path.to_string_lossy().as_ref()) {
             out_paths.push(path);
@@ -306,6 +386,120 @@ pub fn find_paths(
     Ok(out_paths)
 }
 
+/// The number of directories in a level before they are read on several threads.
+const PARALLEL_SCAN_THRESHOLD: usize = 16;
+
+/// Read the directories in order, returning the sorted entries in each that match the pattern.
+///
+/// Directories that do not exist or are not directories are skipped. If the entries are not the
+/// last level of the path, then only the directories are returned.
+fn scan_directories(
+    parent_paths: &[std::path::PathBuf],
+    pattern: &regex::Regex,
+    is_last_part: bool,
+) -> Result<Vec<std::path::PathBuf>, crate::Error> {
+    let mut paths = Vec::new();
+
+    for parent_path in parent_paths.iter() {
+        let read_dir_path = if parent_path.as_os_str().is_empty() {
+            std::path::Path::new(".")
+        } else {
+            parent_path.as_path()
+        };
+        let entries = match std::fs::read_dir(read_dir_path) {
+            Ok(entries) => entries,
+            Err(error)
+                if matches!(
+                    error.kind(),
+                    std::io::ErrorKind::NotFound | std::io::ErrorKind::NotADirectory
+                ) =>
+            {
+                continue;
+            }
+            Err(error) => return Err(error.into()),
+        };
+        let mut names = Vec::new();
+
+        for entry in entries {
+            let entry = entry?;
+            let name = entry.file_name();
+            let is_match = match name.to_str() {
+                Some(name) => pattern.is_match(name),
+                None => false,
+            };
+
+            if is_match && (is_last_part || is_dir_entry(&entry)?) {
+                names.push(name);
+            }
+        }
+
+        names.sort();
+        paths.reserve(names.len());
+
+        for name in names {
+            paths.push(parent_path.join(name));
+        }
+    }
+
+    Ok(paths)
+}
+
+/// The same as [scan_directories], but the directories are split between scoped threads.
+///
+/// The results are joined in the order of the input directories, so the paths are the same as
+/// when they are read on a single thread.
+fn scan_directories_parallel(
+    parent_paths: &[std::path::PathBuf],
+    pattern: &regex::Regex,
+    is_last_part: bool,
+) -> Result<Vec<std::path::PathBuf>, crate::Error> {
+    let thread_count = std::thread::available_parallelism()
+        .map(|count| count.get())
+        .unwrap_or(1)
+        .min(parent_paths.len());
+
+    if thread_count <= 1 {
+        return scan_directories(parent_paths, pattern, is_last_part);
+    }
+
+    let chunk_size = parent_paths.len().div_ceil(thread_count);
+
+    std::thread::scope(|scope| {
+        let handles: Vec<_> = parent_paths
+            .chunks(chunk_size)
+            .map(|chunk| scope.spawn(move || scan_directories(chunk, pattern, is_last_part)))
+            .collect();
+        let mut chunk_paths = Vec::with_capacity(handles.len());
+
+        for handle in handles {
+            match handle.join() {
+                Ok(result) => chunk_paths.push(result?),
+                Err(panic) => std::panic::resume_unwind(panic),
+            }
+        }
+
+        // The chunk sizes are known once they are all joined, so the paths are only copied once.
+        let mut paths = Vec::with_capacity(chunk_paths.iter().map(Vec::len).sum());
+
+        for chunk in chunk_paths {
+            paths.extend(chunk);
+        }
+
+        Ok(paths)
+    })
+}
+
+fn is_dir_entry(entry: &std::fs::DirEntry) -> Result<bool, crate::Error> {
+    let file_type = entry.file_type()?;
+
+    if file_type.is_symlink() {
+        // The file type of the entry does not follow the link, so look up what it points to.
+        return Ok(std::fs::metadata(entry.path()).is_ok_and(|metadata| metadata.is_dir()));
+    }
+
+    Ok(file_type.is_dir())
+}
+
 #[cfg(test)]
 mod tests {
     use crate::{Owner, PathItemArgs, PathType, Permission};
@@ -372,6 +566,42 @@ mod tests {
         assert_eq!(fields, expected_fields);
     }
 
+    #[test]
+    fn test_get_path_from_fields_success() {
+        let config = crate::ConfigBuilder::new()
+            .add_integer_resolver("thing", 3)
+            .unwrap()
+            .add_path_item(PathItemArgs {
+                key: "key".try_into().unwrap(),
+                path: "/path/to/{thing}".into(),
+                parent: None,
+                permission: Permission::default(),
+                owner: Owner::default(),
+                path_type: PathType::default(),
+                deferred: false,
+                metadata: std::collections::HashMap::new(),
+            })
+            .unwrap()
+            .build()
+            .unwrap();
+        let mut fields = crate::PathFields::new(&config);
+
+        for index in 0..3u16 {
+            fields.set("thing", index).unwrap();
+            let path = get_path_from_fields(&config, "key", &fields).unwrap();
+
+            assert_eq!(
+                path,
+                std::path::PathBuf::from(format!("/path/to/{index:03}"))
+            );
+        }
+
+        fields.clear();
+        let err = get_path_from_fields(&config, "key", &fields).unwrap_err();
+
+        assert_eq!(err.to_string(), "Could not find \"thing\" in the fields.");
+    }
+
     #[test]
     fn test_get_key_success() {
         let config = crate::ConfigBuilder::new()
@@ -403,6 +633,51 @@ mod tests {
         assert_eq!(result.to_string(), "key");
     }
 
+    #[rstest::rstest]
+    #[case("/path/to/value", "value", Some("thing"))]
+    #[case("/path/to/value/file", "value", Some("file"))]
+    #[case("/path/other/value", "value", Some("other"))]
+    #[case("/root/value/file", "/root/value", Some("file"))]
+    #[case("/path/to/missing", "value", None)]
+    fn test_get_key_multiple_items_success(
+        #[case] path: &str,
+        #[case] thing: &str,
+        #[case] expected: Option<&str>,
+    ) {
+        let mut builder = crate::ConfigBuilder::new();
+
+        for (key, path, parent) in [
+            ("thing", "/path/to/{thing}", None),
+            ("file", "file", Some("thing")),
+            ("other", "/path/other/{thing}", None),
+        ] {
+            builder = builder
+                .add_path_item(PathItemArgs {
+                    key: key.try_into().unwrap(),
+                    path: path.into(),
+                    parent: parent.map(|parent| parent.try_into().unwrap()),
+                    permission: Permission::default(),
+                    owner: Owner::default(),
+                    path_type: PathType::default(),
+                    deferred: false,
+                    metadata: std::collections::HashMap::new(),
+                })
+                .unwrap();
+        }
+
+        let config = builder.build().unwrap();
+        let fields = {
+            let mut fields = crate::types::PathAttributes::new();
+            fields.insert("thing".try_into().unwrap(), thing.into());
+
+            fields
+        };
+
+        let result = get_key(&config, path, &fields).unwrap();
+
+        assert_eq!(result.map(|key| key.as_str()), expected);
+    }
+
     #[test]
     fn test_find_paths_success() {
         let tmp_dir = tempfile::tempdir().unwrap();
@@ -462,4 +737,201 @@ mod tests {
 
         assert_eq!(expected_paths, result_paths);
     }
+
+    #[test]
+    fn test_find_paths_integer_field_success() {
+        let tmp_dir = tempfile::tempdir().unwrap();
+        let root_dir = tmp_dir.path();
+        let test_dir = root_dir.join("path/to");
+        std::fs::create_dir_all(&test_dir).unwrap();
+        let mut expected_paths = Vec::new();
+
+        for name in ["v001", "v002", "v1000", "v01", "vabc", "v00a"] {
+            let path = test_dir.join(name);
+            std::fs::create_dir(&path).unwrap();
+
+            if ["v001", "v002", "v1000"].contains(&name) {
+                expected_paths.push(path);
+            }
+        }
+
+        expected_paths.sort();
+
+        let config = crate::ConfigBuilder::new()
+            .add_integer_resolver("version", 3)
+            .unwrap()
+            .add_path_item(PathItemArgs {
+                key: "root".try_into().unwrap(),
+                path: root_dir.to_path_buf(),
+                parent: None,
+                permission: Permission::default(),
+                owner: Owner::default(),
+                path_type: PathType::default(),
+                deferred: false,
+                metadata: std::collections::HashMap::new(),
+            })
+            .unwrap()
+            .add_path_item(PathItemArgs {
+                key: "key".try_into().unwrap(),
+                path: "path/to/v{version}".into(),
+                parent: Some("root".try_into().unwrap()),
+                permission: Permission::default(),
+                owner: Owner::default(),
+                path_type: PathType::default(),
+                deferred: false,
+                metadata: std::collections::HashMap::new(),
+            })
+            .unwrap()
+            .build()
+            .unwrap();
+
+        let mut result_paths =
+            find_paths(&config, "key", &crate::types::PathAttributes::new()).unwrap();
+        result_paths.sort();
+
+        assert_eq!(expected_paths, result_paths);
+    }
+
+    #[test]
+    fn test_find_paths_resolved_parts_after_wildcard_success() {
+        let tmp_dir = tempfile::tempdir().unwrap();
+        let root_dir = tmp_dir.path();
+        std::fs::create_dir_all(root_dir.join("a/data")).unwrap();
+        std::fs::write(root_dir.join("a/data/file.txt"), "test").unwrap();
+        std::fs::create_dir_all(root_dir.join("b/data")).unwrap();
+        std::fs::create_dir_all(root_dir.join("c")).unwrap();
+        // A file where a directory is expected is skipped rather than read.
+        std::fs::write(root_dir.join("d"), "test").unwrap();
+
+        let config = crate::ConfigBuilder::new()
+            .add_path_item(PathItemArgs {
+                key: "root".try_into().unwrap(),
+                path: root_dir.to_path_buf(),
+                parent: None,
+                permission: Permission::default(),
+                owner: Owner::default(),
+                path_type: PathType::default(),
+                deferred: false,
+                metadata: std::collections::HashMap::new(),
+            })
+            .unwrap()
+            .add_path_item(PathItemArgs {
+                key: "key".try_into().unwrap(),
+                path: "{thing}/data/file.txt".into(),
+                parent: Some("root".try_into().unwrap()),
+                permission: Permission::default(),
+                owner: Owner::default(),
+                path_type: PathType::File,
+                deferred: false,
+                metadata: std::collections::HashMap::new(),
+            })
+            .unwrap()
+            .build()
+            .unwrap();
+
+        let result_paths =
+            find_paths(&config, "key", &crate::types::PathAttributes::new()).unwrap();
+
+        assert_eq!(result_paths, vec![root_dir.join("a/data/file.txt")]);
+    }
+
+    #[test]
+    fn test_find_paths_value_with_separator_success() {
+        let tmp_dir = tempfile::tempdir().unwrap();
+        let root_dir = tmp_dir.path();
+        std::fs::create_dir_all(root_dir.join("x")).unwrap();
+        std::fs::write(root_dir.join("x/y_1.txt"), "test").unwrap();
+        std::fs::write(root_dir.join("x/y_2.txt"), "test").unwrap();
+        std::fs::write(root_dir.join("x/z_1.txt"), "test").unwrap();
+
+        let config = crate::ConfigBuilder::new()
+            .add_path_item(PathItemArgs {
+                key: "root".try_into().unwrap(),
+                path: root_dir.to_path_buf(),
+                parent: None,
+                permission: Permission::default(),
+                owner: Owner::default(),
+                path_type: PathType::default(),
+                deferred: false,
+                metadata: std::collections::HashMap::new(),
+            })
+            .unwrap()
+            .add_path_item(PathItemArgs {
+                key: "key".try_into().unwrap(),
+                path: "{thing}_{frame}.txt".into(),
+                parent: Some("root".try_into().unwrap()),
+                permission: Permission::default(),
+                owner: Owner::default(),
+                path_type: PathType::File,
+                deferred: false,
+                metadata: std::collections::HashMap::new(),
+            })
+            .unwrap()
+            .build()
+            .unwrap();
+        let fields = {
+            let mut fields = crate::types::PathAttributes::new();
+            fields.insert("thing".try_into().unwrap(), "x/y".into());
+            fields
+        };
+
+        let result_paths = find_paths(&config, "key", &fields).unwrap();
+
+        // The value covers two levels, so the leading level is joined before the entries are read.
+        assert_eq!(
+            result_paths,
+            vec![root_dir.join("x/y_1.txt"), root_dir.join("x/y_2.txt")]
+        );
+    }
+
+    #[test]
+    fn test_find_paths_many_directories_success() {
+        let tmp_dir = tempfile::tempdir().unwrap();
+        let root_dir = tmp_dir.path();
+        let mut expected_paths = Vec::new();
+
+        // Enough directories in the level to be read on several threads.
+        for dir_index in 0..(PARALLEL_SCAN_THRESHOLD * 3) {
+            let test_dir = root_dir.join(format!("dir_{dir_index:03}"));
+            std::fs::create_dir(&test_dir).unwrap();
+
+            for file_index in 0..3 {
+                let path = test_dir.join(format!("file_{file_index}.txt"));
+                std::fs::write(&path, "test").unwrap();
+                expected_paths.push(path);
+            }
+        }
+
+        let config = crate::ConfigBuilder::new()
+            .add_path_item(PathItemArgs {
+                key: "root".try_into().unwrap(),
+                path: root_dir.to_path_buf(),
+                parent: None,
+                permission: Permission::default(),
+                owner: Owner::default(),
+                path_type: PathType::default(),
+                deferred: false,
+                metadata: std::collections::HashMap::new(),
+            })
+            .unwrap()
+            .add_path_item(PathItemArgs {
+                key: "key".try_into().unwrap(),
+                path: "{thing}/{frame}.txt".into(),
+                parent: Some("root".try_into().unwrap()),
+                permission: Permission::default(),
+                owner: Owner::default(),
+                path_type: PathType::File,
+                deferred: false,
+                metadata: std::collections::HashMap::new(),
+            })
+            .unwrap()
+            .build()
+            .unwrap();
+
+        let result_paths =
+            find_paths(&config, "key", &crate::types::PathAttributes::new()).unwrap();
+
+        // The paths are in the same order as when the directories are read on one thread.
+        assert_eq!(result_paths, expected_paths);
+    }
 }
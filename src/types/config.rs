@@ -1,4 +1,7 @@
-use crate::types::{FieldKey, PathItem, PathItemArgs, Resolver, Resolvers, Tokens};
+use crate::types::{
+    FieldIndex, FieldKey, ItemTree, PathItem, PathItemArgs, PathItemAttributes, PathProgram,
+    Resolver, Resolvers,
+};
 
 /// Store the resolver configs.
 ///
@@ -8,8 +11,16 @@ use crate::types::{FieldKey, PathItem, PathItemArgs, Resolver, Resolvers, Tokens
 #[derive(Debug, Clone)]
 pub struct Config {
     pub(crate) resolvers: Resolvers,
+    // Shared with the path fields built from the config, so they can check they belong to it.
+    pub(crate) field_index: std::sync::Arc<FieldIndex>,
     pub(crate) item_map: std::collections::HashMap<FieldKey, usize>,
     pub(crate) items: Vec<PathItem>,
+    // Stored next to the items rather than in them, since only the workspace resolver needs them.
+    pub(crate) item_attributes: Vec<PathItemAttributes>,
+    pub(crate) item_tree: ItemTree,
+    pub(crate) path_programs: std::collections::HashMap<FieldKey, PathProgram>,
+    pub(crate) path_patterns: std::collections::HashMap<FieldKey, std::sync::Arc<regex::Regex>>,
+    pub(crate) workspace_cache: std::sync::Arc<crate::cache::WorkspaceCache>,
 }
 
 impl Config {
@@ -35,6 +46,42 @@ impl Config {
 
         Some(items.iter().rev().copied().collect())
     }
+
+    /// Compile the regex that matches the full path of every keyed item.
+    ///
+    /// The patterns only depend on the items and the resolvers, so they can be built once with
+    /// the config rather than every time the filesystem is searched.
+    fn compile_path_patterns(
+        &self,
+    ) -> Result<std::collections::HashMap<FieldKey, std::sync::Arc<regex::Regex>>, crate::Error>
+    {
+        let mut path_patterns = std::collections::HashMap::with_capacity(self.item_map.len());
+        let mut regex_pattern = String::new();
+
+        for key in self.item_map.keys() {
+            let item = match self.get_item(key) {
+                Some(item) => item,
+                None => continue,
+            };
+
+            regex_pattern.clear();
+            regex_pattern.push('^');
+
+            for (index, part) in item.iter().enumerate() {
+                part.path
+                    .draw_regex_pattern(&mut regex_pattern, &self.resolvers)?;
+
+                if index != item.len() - 1 && !regex_pattern.ends_with(r"[\\/]") {
+                    regex_pattern.push_str(r"[\\/]");
+                }
+            }
+
+            regex_pattern.push('$');
+            path_patterns.insert(key.clone(), crate::cache::regex(&regex_pattern)?);
+        }
+
+        Ok(path_patterns)
+    }
 }
 
 /// Build a config.
@@ -208,18 +255,21 @@ impl ConfigBuilder {
 
         let mut key_path_map = std::collections::HashMap::new();
         let mut path_metadata_map = std::collections::HashMap::new();
+        let mut field_index = FieldIndex::new();
 
-        for (key, item) in self.items.iter() {
+        for (key, item) in self.items.iter_mut() {
+            // The builder owns the items, so the metadata is moved out rather than copied.
+            let metadata = std::mem::take(&mut item.metadata);
             key_path_map.insert(key, &item.path);
             path_metadata_map.insert(
                 &item.path,
-                (
-                    item.permission,
-                    item.owner,
-                    item.path_type,
-                    item.deferred,
-                    item.metadata.clone(),
-                ),
+                PathItemAttributes {
+                    permission: item.permission,
+                    owner: item.owner,
+                    path_type: item.path_type,
+                    deferred: item.deferred,
+                    metadata: std::sync::Arc::new(metadata),
+                },
             );
 
             let path: &std::path::Path = item.path.as_ref();
@@ -236,15 +286,7 @@ impl ConfigBuilder {
                 Some(name) => name.to_string_lossy(),
                 None => path.to_string_lossy(),
             };
-            parent_path_items.push(PathItem {
-                path: Tokens::new(&name)?,
-                parent: None,
-                permission: crate::Permission::default(),
-                owner: crate::Owner::default(),
-                path_type: crate::PathType::default(),
-                deferred: true,
-                metadata: std::collections::HashMap::new(),
-            });
+            parent_path_items.push(PathItem::new(&name, &self.resolvers, &mut field_index)?);
 
             let mut path: &std::path::Path = item.path.as_ref();
 
@@ -274,15 +316,7 @@ impl ConfigBuilder {
                     None => path.to_string_lossy(),
                 };
 
-                parent_path_items.push(PathItem {
-                    path: Tokens::new(&name)?,
-                    parent: None,
-                    permission: crate::Permission::default(),
-                    owner: crate::Owner::default(),
-                    path_type: crate::PathType::default(),
-                    deferred: true,
-                    metadata: std::collections::HashMap::new(),
-                });
+                parent_path_items.push(PathItem::new(&name, &self.resolvers, &mut field_index)?);
 
                 path = parent;
             }
@@ -297,15 +331,7 @@ impl ConfigBuilder {
                     Some(name) => name.to_string_lossy(),
                     None => path.to_string_lossy(),
                 };
-                parent_path_items.push(PathItem {
-                    path: Tokens::new(&name)?,
-                    parent: None,
-                    permission: crate::Permission::default(),
-                    owner: crate::Owner::default(),
-                    path_type: crate::PathType::default(),
-                    deferred: true,
-                    metadata: std::collections::HashMap::new(),
-                });
+                parent_path_items.push(PathItem::new(&name, &self.resolvers, &mut field_index)?);
 
                 visited_paths.insert(None);
             }
@@ -342,24 +368,35 @@ impl ConfigBuilder {
             }
         }
 
-        for (index, item) in items.iter_mut().enumerate() {
-            if let Some(path) = index_path_map.get(&index)
-                && let Some((permission, owner, path_type, deferred, metadata)) =
-                    path_metadata_map.remove(path)
-            {
-                item.permission = permission;
-                item.owner = owner;
-                item.path_type = path_type;
-                item.deferred = deferred;
-                item.metadata = metadata;
-            }
+        let mut item_attributes = Vec::with_capacity(items.len());
+
+        for index in 0..items.len() {
+            let attributes = match index_path_map.get(&index) {
+                Some(path) => path_metadata_map.remove(path).unwrap_or_default(),
+                None => PathItemAttributes::default(),
+            };
+            item_attributes.push(attributes);
         }
 
-        Ok(Config {
+        let item_tree = ItemTree::new(&items, &item_map);
+        let path_programs = item_map
+            .iter()
+            .map(|(key, index)| (key.clone(), PathProgram::new(&items, *index)))
+            .collect();
+        let mut config = Config {
             resolvers: self.resolvers,
+            field_index: std::sync::Arc::new(field_index),
             items,
+            item_attributes,
             item_map,
-        })
+            item_tree,
+            path_programs,
+            path_patterns: std::collections::HashMap::new(),
+            workspace_cache: std::sync::Arc::new(crate::cache::WorkspaceCache::new()),
+        };
+        config.path_patterns = config.compile_path_patterns()?;
+
+        Ok(config)
     }
 }
 
@@ -604,6 +641,44 @@ mod tests {
         );
     }
 
+    #[test]
+    fn test_config_path_patterns_success() {
+        let config = ConfigBuilder::new()
+            .add_integer_resolver("version", 3)
+            .unwrap()
+            .add_path_item(PathItemArgs {
+                key: "parent".try_into().unwrap(),
+                path: "/parent/{thing}".into(),
+                parent: None,
+                permission: Permission::default(),
+                owner: Owner::default(),
+                path_type: PathType::default(),
+                deferred: false,
+                metadata: std::collections::HashMap::new(),
+            })
+            .unwrap()
+            .add_path_item(PathItemArgs {
+                key: "child".try_into().unwrap(),
+                path: "v{version}".into(),
+                parent: Some("parent".try_into().unwrap()),
+                permission: Permission::default(),
+                owner: Owner::default(),
+                path_type: PathType::default(),
+                deferred: false,
+                metadata: std::collections::HashMap::new(),
+            })
+            .unwrap()
+            .build()
+            .unwrap();
+
+        assert_eq!(config.path_patterns.len(), config.item_map.len());
+
+        let pattern = &config.path_patterns[&"child".try_into().unwrap()];
+        assert!(pattern.is_match("/parent/value/v001"));
+        assert!(!pattern.is_match("/parent/value/v01"));
+        assert!(!pattern.is_match("/parent/value"));
+    }
+
     #[test]
     fn test_config_get_item_metadata_success() {
         let config = ConfigBuilder::new()
@@ -623,9 +698,9 @@ mod tests {
             .build()
             .unwrap();
 
-        let item = config.get_item(&"item".try_into().unwrap()).unwrap();
+        let index = config.item_map[&"item".try_into().unwrap()];
         assert_eq!(
-            item[1].metadata.get("test"),
+            config.item_attributes[index].metadata.get("test"),
             Some(&crate::MetadataValue::Integer(123))
         );
     }
@@ -0,0 +1,126 @@
+use crate::types::{FieldKey, PathAttributes, PathValue, Resolver, Resolvers};
+
+/// The path values for a single call, indexed by the field ids from a [FieldIndex].
+pub(crate) type FieldValues<'a> = Vec<Option<&'a PathValue>>;
+
+/// Map the placeholders used by a config's path items to dense ids.
+///
+/// Every placeholder is given an id when the config is built, along with the resolver it uses, so
+/// resolving a path only needs to hash the input fields once per call instead of once per
+/// placeholder in every path part.
+#[derive(Debug, Clone, Default)]
+pub(crate) struct FieldIndex {
+    ids: std::collections::HashMap<FieldKey, usize>,
+    keys: Vec<FieldKey>,
+    resolvers: Vec<Resolver>,
+}
+
+impl FieldIndex {
+    pub(crate) fn new() -> Self {
+        Self::default()
+    }
+
+    /// Get the id for the key, adding the key if it has not been seen yet.
+    pub(crate) fn intern(&mut self, key: &FieldKey, resolvers: &Resolvers) -> usize {
+        if let Some(id) = self.ids.get(key) {
+            return *id;
+        }
+
+        let id = self.keys.len();
+        let resolver = match resolvers.get(key) {
+            Some(resolver) => resolver.clone(),
+            None => Resolver::Default,
+        };
+
+        self.ids.insert(key.clone(), id);
+        self.keys.push(key.clone());
+        self.resolvers.push(resolver);
+
+        id
+    }
+
+    pub(crate) fn id(&self, key: &FieldKey) -> Option<usize> {
+        self.ids.get(key).copied()
+    }
+
+    pub(crate) fn len(&self) -> usize {
+        self.keys.len()
+    }
+
+    pub(crate) fn key(&self, id: usize) -> &FieldKey {
+        &self.keys[id]
+    }
+
+    pub(crate) fn resolver(&self, id: usize) -> &Resolver {
+        &self.resolvers[id]
+    }
+
+    /// Convert the input fields into values that can be looked up by id.
+    ///
+    /// Fields that are not used by any of the path items are ignored.
+    pub(crate) fn values<'a>(&self, fields: &'a PathAttributes) -> FieldValues<'a> {
+        let mut values = vec![None; self.keys.len()];
+
+        for (key, value) in fields.iter() {
+            if let Some(id) = self.ids.get(key) {
+                values[*id] = Some(value);
+            }
+        }
+
+        values
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_field_index_intern_success() {
+        let resolvers = {
+            let mut resolvers = Resolvers::new();
+            resolvers.insert(
+                "test_int".try_into().unwrap(),
+                Resolver::Integer { padding: 3 },
+            );
+            resolvers
+        };
+        let mut index = FieldIndex::new();
+
+        let str_id = index.intern(&"test_str".try_into().unwrap(), &resolvers);
+        let int_id = index.intern(&"test_int".try_into().unwrap(), &resolvers);
+
+        assert_ne!(str_id, int_id);
+        assert_eq!(
+            index.intern(&"test_str".try_into().unwrap(), &resolvers),
+            str_id
+        );
+        assert_eq!(index.key(str_id).as_str(), "test_str");
+        assert_eq!(index.key(int_id).as_str(), "test_int");
+        assert!(matches!(index.resolver(str_id), Resolver::Default));
+        assert!(matches!(
+            index.resolver(int_id),
+            Resolver::Integer { padding: 3 }
+        ));
+    }
+
+    #[test]
+    fn test_field_index_values_success() {
+        let mut index = FieldIndex::new();
+        let str_id = index.intern(&"test_str".try_into().unwrap(), &Resolvers::new());
+        let int_id = index.intern(&"test_int".try_into().unwrap(), &Resolvers::new());
+
+        let fields = {
+            let mut fields = PathAttributes::new();
+            fields.insert("test_str".try_into().unwrap(), "test".into());
+            fields.insert("unused".try_into().unwrap(), "test".into());
+            fields
+        };
+
+        let values = index.values(&fields);
+
+        assert_eq!(values.len(), 2);
+        assert_eq!(values[str_id], Some(&PathValue::String("test".into())));
+        assert_eq!(values[int_id], None);
+    }
+}
@@ -0,0 +1,130 @@
+use crate::types::{FieldKey, FieldValues, PathItem, PathValue};
+
+/// The config's path items arranged as a tree, from the root items down to their children.
+///
+/// Items with the same parent path share the same parent item, so walking the tree top-down draws
+/// each shared path part once, and a whole branch can be skipped as soon as its path stops
+/// matching the path that is being looked up.
+#[derive(Debug, Clone, Default)]
+pub(crate) struct ItemTree {
+    pub(crate) roots: Vec<usize>,
+    pub(crate) children: Vec<Vec<usize>>,
+    pub(crate) keys: Vec<Option<FieldKey>>,
+    // The fields that start a child item. A rooted value for one of these replaces the parent's
+    // path when the child is joined to it, so the parent's path is no longer a prefix.
+    rooted_fields: Vec<usize>,
+}
+
+impl ItemTree {
+    pub(crate) fn new(
+        items: &[PathItem],
+        item_map: &std::collections::HashMap<FieldKey, usize>,
+    ) -> Self {
+        let mut tree = Self {
+            roots: Vec::new(),
+            children: vec![Vec::new(); items.len()],
+            keys: vec![None; items.len()],
+            rooted_fields: Vec::new(),
+        };
+
+        for (index, item) in items.iter().enumerate() {
+            match item.parent {
+                Some(parent_index) => {
+                    tree.children[parent_index].push(index);
+
+                    if let Some(id) = item.render.first_field()
+                        && !tree.rooted_fields.contains(&id)
+                    {
+                        tree.rooted_fields.push(id);
+                    }
+                }
+                None => tree.roots.push(index),
+            }
+        }
+
+        for (key, index) in item_map.iter() {
+            tree.keys[*index] = Some(key.clone());
+        }
+
+        tree
+    }
+
+    /// Whether a branch can be skipped once its path is not a prefix of the path being looked
+    /// up.
+    ///
+    /// This is only true if none of the child items can replace their parent's path with the
+    /// given values.
+    pub(crate) fn can_skip_branches(&self, values: &FieldValues) -> bool {
+        for id in self.rooted_fields.iter() {
+            if let Some(PathValue::String(value)) = values[*id] {
+                let path = std::path::Path::new(value);
+
+                if path.has_root()
+                    || matches!(
+                        path.components().next(),
+                        Some(std::path::Component::Prefix(_))
+                    )
+                {
+                    return false;
+                }
+            }
+        }
+
+        true
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use crate::types::{FieldIndex, PathAttributes, Resolvers};
+
+    use super::*;
+
+    fn build_items(index: &mut FieldIndex) -> Vec<PathItem> {
+        let mut items = Vec::new();
+
+        for (name, parent) in [("{root}", None), ("path", Some(0)), ("{thing}", Some(1))] {
+            let mut item = PathItem::new(name, &Resolvers::new(), index).unwrap();
+            item.parent = parent;
+            items.push(item);
+        }
+
+        items
+    }
+
+    #[test]
+    fn test_item_tree_new_success() {
+        let mut index = FieldIndex::new();
+        let items = build_items(&mut index);
+        let item_map = {
+            let mut item_map = std::collections::HashMap::new();
+            item_map.insert("key".try_into().unwrap(), 2);
+            item_map
+        };
+
+        let tree = ItemTree::new(&items, &item_map);
+
+        assert_eq!(tree.roots, vec![0]);
+        assert_eq!(tree.children, vec![vec![1], vec![2], vec![]]);
+        assert_eq!(tree.keys, vec![None, None, Some("key".try_into().unwrap())]);
+    }
+
+    #[rstest::rstest]
+    #[case("value", true)]
+    #[case("path/to/value", true)]
+    #[case("/path/to/value", false)]
+    fn test_item_tree_can_skip_branches_success(#[case] value: &str, #[case] expected: bool) {
+        let mut index = FieldIndex::new();
+        let items = build_items(&mut index);
+        let tree = ItemTree::new(&items, &std::collections::HashMap::new());
+        let fields = {
+            let mut fields = PathAttributes::new();
+            // The root item can always be rooted, since it has no parent path to replace.
+            fields.insert("root".try_into().unwrap(), "/root".into());
+            fields.insert("thing".try_into().unwrap(), value.into());
+            fields
+        };
+
+        assert_eq!(tree.can_skip_branches(&index.values(&fields)), expected);
+    }
+}
@@ -1,6 +1,11 @@
 mod config;
+mod field_index;
 mod field_key;
+mod item_tree;
+mod path_fields;
 mod path_item;
+mod path_program;
+mod render;
 mod resolver;
 mod token;
 mod value;
@@ -10,9 +15,14 @@ pub(crate) type TemplateAttributes = std::collections::HashMap<FieldKey, Templat
 pub(crate) type Resolvers = std::collections::HashMap<FieldKey, Resolver>;
 
 pub use config::{Config, ConfigBuilder};
+pub(crate) use field_index::{FieldIndex, FieldValues};
 pub use field_key::FieldKey;
-pub(crate) use path_item::PathItem;
+pub(crate) use item_tree::ItemTree;
+pub use path_fields::PathFields;
 pub use path_item::{Owner, PathItemArgs, PathType, Permission, ResolvedPathItem};
+pub(crate) use path_item::{PathItem, PathItemAttributes};
+pub(crate) use path_program::PathProgram;
+pub(crate) use render::{PartLevel, RenderProgram};
 pub use resolver::Resolver;
 pub(crate) use token::{Token, Tokens};
 pub use value::{MetadataValue, PathValue, TemplateValue};
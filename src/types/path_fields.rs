@@ -0,0 +1,163 @@
+use crate::types::{FieldIndex, FieldKey, FieldValues, PathValue};
+
+/// Path fields that are bound to a config.
+///
+/// This is an alternative to the field maps for resolving many paths from the same config. The
+/// values are stored by the config's placeholder ids when they are set, so resolving a path does
+/// not need to look up the fields again. The fields can be reused between calls by updating or
+/// clearing them.
+///
+/// Fields that are not used by any of the config's paths are ignored.
+///
+/// # Example
+///
+/// ```rust
+/// # use openpathresolver::{ConfigBuilder, get_path_from_fields, Owner, PathFields, PathItemArgs, PathType, Permission};
+/// let config = ConfigBuilder::new()
+///     .add_path_item(PathItemArgs {
+///         key: "key".try_into().unwrap(),
+///         path: "/path/to/{thing}".into(),
+///         parent: None,
+///         permission: Permission::default(),
+///         owner: Owner::default(),
+///         path_type: PathType::default(),
+///         deferred: false,
+///         metadata: std::collections::HashMap::new(),
+///     })
+///     .unwrap()
+///     .build()
+///     .unwrap();
+///
+/// let mut fields = PathFields::new(&config);
+///
+/// for thing in ["a", "b"] {
+///     fields.set("thing", thing).unwrap();
+///     let path = get_path_from_fields(&config, "key", &fields).unwrap();
+///
+///     assert_eq!(path, std::path::PathBuf::from(format!("/path/to/{thing}")));
+/// }
+/// ```
+#[derive(Debug, Clone)]
+pub struct PathFields {
+    field_index: std::sync::Arc<FieldIndex>,
+    values: Vec<Option<PathValue>>,
+}
+
+impl PathFields {
+    /// Create empty fields for the config.
+    pub fn new(config: &crate::Config) -> Self {
+        Self {
+            field_index: config.field_index.clone(),
+            values: vec![None; config.field_index.len()],
+        }
+    }
+
+    /// Set the value of a field.
+    pub fn set(
+        &mut self,
+        key: impl TryInto<FieldKey, Error = crate::Error>,
+        value: impl Into<PathValue>,
+    ) -> Result<(), crate::Error> {
+        if let Some(id) = self.field_index.id(&key.try_into()?) {
+            self.values[id] = Some(value.into());
+        }
+
+        Ok(())
+    }
+
+    /// Remove the value of a field.
+    pub fn remove(
+        &mut self,
+        key: impl TryInto<FieldKey, Error = crate::Error>,
+    ) -> Result<Option<PathValue>, crate::Error> {
+        match self.field_index.id(&key.try_into()?) {
+            Some(id) => Ok(self.values[id].take()),
+            None => Ok(None),
+        }
+    }
+
+    /// Remove all of the values.
+    pub fn clear(&mut self) {
+        for value in self.values.iter_mut() {
+            *value = None;
+        }
+    }
+
+    pub(crate) fn values(&self, config: &crate::Config) -> Result<FieldValues<'_>, crate::Error> {
+        if !std::sync::Arc::ptr_eq(&self.field_index, &config.field_index) {
+            return Err(crate::Error::new(
+                "The fields were created for a different config.",
+            ));
+        }
+
+        Ok(self.values.iter().map(|value| value.as_ref()).collect())
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use crate::{Owner, PathItemArgs, PathType, Permission};
+
+    use super::*;
+
+    fn build_config() -> crate::Config {
+        crate::ConfigBuilder::new()
+            .add_path_item(PathItemArgs {
+                key: "key".try_into().unwrap(),
+                path: "/path/to/{thing}".into(),
+                parent: None,
+                permission: Permission::default(),
+                owner: Owner::default(),
+                path_type: PathType::default(),
+                deferred: false,
+                metadata: std::collections::HashMap::new(),
+            })
+            .unwrap()
+            .build()
+            .unwrap()
+    }
+
+    #[test]
+    fn test_path_fields_set_success() {
+        let config = build_config();
+        let mut fields = PathFields::new(&config);
+
+        fields.set("thing", "value").unwrap();
+        fields.set("unused", "value").unwrap();
+
+        assert_eq!(
+            fields.values(&config).unwrap(),
+            vec![Some(&PathValue::String("value".into()))]
+        );
+    }
+
+    #[test]
+    fn test_path_fields_remove_and_clear_success() {
+        let config = build_config();
+        let mut fields = PathFields::new(&config);
+
+        fields.set("thing", "value").unwrap();
+        assert_eq!(
+            fields.remove("thing").unwrap(),
+            Some(PathValue::String("value".into()))
+        );
+        assert_eq!(fields.remove("unused").unwrap(), None);
+
+        fields.set("thing", "value").unwrap();
+        fields.clear();
+        assert_eq!(fields.values(&config).unwrap(), vec![None]);
+    }
+
+    #[test]
+    fn test_path_fields_values_failure_different_config() {
+        let config = build_config();
+        let fields = PathFields::new(&build_config());
+
+        let err = fields.values(&config).unwrap_err();
+
+        assert_eq!(
+            err.to_string(),
+            "The fields were created for a different config."
+        );
+    }
+}
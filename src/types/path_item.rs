@@ -1,4 +1,4 @@
-use crate::types::{FieldKey, Tokens};
+use crate::types::{FieldIndex, FieldKey, RenderProgram, Resolvers, Tokens};
 
 /// Input path item arguments
 ///
@@ -33,15 +33,59 @@ pub struct PathItemArgs {
     pub metadata: std::collections::HashMap<String, crate::MetadataValue>,
 }
 
+/// The parts of a path item that are needed to resolve paths.
+///
+/// The attributes that are only needed when building a workspace are stored separately in
+/// [PathItemAttributes], so walking the items while resolving paths does not need to pull them in.
 #[derive(Debug, Clone)]
 pub(crate) struct PathItem {
     pub(crate) path: Tokens,
+    // Compiled once when the config is built, since the resolvers cannot change afterwards.
+    pub(crate) pattern: std::sync::Arc<regex::Regex>,
+    pub(crate) render: RenderProgram,
     pub(crate) parent: Option<usize>,
+}
+
+impl PathItem {
+    pub(crate) fn new(
+        name: &str,
+        resolvers: &Resolvers,
+        field_index: &mut FieldIndex,
+    ) -> Result<Self, crate::Error> {
+        let path = Tokens::new(&name)?;
+        let pattern = path.compile_regex_pattern(resolvers)?;
+        let render = RenderProgram::new(&path, field_index, resolvers);
+
+        Ok(Self {
+            path,
+            pattern,
+            render,
+            parent: None,
+        })
+    }
+}
+
+/// The parts of a path item that are only needed when building a workspace.
+#[derive(Debug, Clone)]
+pub(crate) struct PathItemAttributes {
     pub(crate) permission: Permission,
     pub(crate) owner: Owner,
     pub(crate) path_type: PathType,
     pub(crate) deferred: bool,
-    pub(crate) metadata: std::collections::HashMap<String, crate::MetadataValue>,
+    // Shared with every resolved item for the path, rather than cloned into each of them.
+    pub(crate) metadata: std::sync::Arc<std::collections::HashMap<String, crate::MetadataValue>>,
+}
+
+impl Default for PathItemAttributes {
+    fn default() -> Self {
+        Self {
+            permission: Permission::default(),
+            owner: Owner::default(),
+            path_type: PathType::default(),
+            deferred: true,
+            metadata: std::sync::Arc::new(std::collections::HashMap::new()),
+        }
+    }
 }
 
 /// The path item that has been validated and resolved in the config.
@@ -53,7 +97,8 @@ pub struct ResolvedPathItem {
     pub(crate) owner: Owner,
     pub(crate) path_type: PathType,
     pub(crate) deferred: bool,
-    pub(crate) metadata: std::collections::HashMap<String, crate::MetadataValue>,
+    pub(crate) metadata: std::sync::Arc<std::collections::HashMap<String, crate::MetadataValue>>,
+    pub(crate) parent_in_workspace: bool,
 }
 
 impl ResolvedPathItem {
@@ -111,6 +156,15 @@ impl ResolvedPathItem {
     pub fn metadata(&self) -> &std::collections::HashMap<String, crate::MetadataValue> {
         &self.metadata
     }
+
+    /// Whether the parent path is also part of the same workspace.
+    ///
+    /// The [create_workspace](crate::create_workspace) function will only call the IO function for
+    /// a path after its parent path has been handled. So if this is true, then the IO function can
+    /// create the path directly without first checking for or creating the parent paths.
+    pub fn parent_in_workspace(&self) -> bool {
+        self.parent_in_workspace
+    }
 }
 
 /// The permission for a path.
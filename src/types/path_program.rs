@@ -0,0 +1,162 @@
+use crate::types::{FieldIndex, FieldValues, PathItem};
+
+#[derive(Clone, Debug, PartialEq, Eq)]
+enum PathStep {
+    /// A run of path parts without any fields, joined when the config is built.
+    Literal(std::path::PathBuf),
+    /// The index of a path item with fields to draw.
+    Render(usize),
+}
+
+/// The full path of a keyed item, specialized when the config is built.
+///
+/// The item's parents are resolved once, and every run of parts without fields is joined ahead of
+/// time, so drawing the path only has to draw the parts with fields and push them between the
+/// prebuilt runs.
+#[derive(Clone, Debug, PartialEq, Eq)]
+pub(crate) struct PathProgram {
+    steps: Vec<PathStep>,
+    capacity: usize,
+    part_capacity: usize,
+}
+
+impl PathProgram {
+    pub(crate) fn new(items: &[PathItem], index: usize) -> Self {
+        let mut indexes = vec![index];
+
+        while let Some(parent_index) = items[*indexes.last().unwrap()].parent {
+            indexes.push(parent_index);
+        }
+
+        let mut steps: Vec<PathStep> = Vec::with_capacity(indexes.len());
+        let mut capacity = 0;
+        let mut part_capacity = 0;
+
+        for index in indexes.into_iter().rev() {
+            let render = &items[index].render;
+            capacity += render.capacity() + 1;
+
+            match render.literal() {
+                // Pushing the joined run gives the same path as pushing each of its parts.
+                Some(literal) => match steps.last_mut() {
+                    Some(PathStep::Literal(path)) => path.push(literal),
+                    _ => steps.push(PathStep::Literal(literal.into())),
+                },
+                None => {
+                    part_capacity = part_capacity.max(render.capacity());
+                    steps.push(PathStep::Render(index));
+                }
+            }
+        }
+
+        Self {
+            steps,
+            capacity,
+            part_capacity,
+        }
+    }
+
+    pub(crate) fn draw(
+        &self,
+        items: &[PathItem],
+        values: &FieldValues,
+        index: &FieldIndex,
+    ) -> Result<std::path::PathBuf, crate::Error> {
+        let mut path = std::path::PathBuf::with_capacity(self.capacity);
+        let mut path_part = String::with_capacity(self.part_capacity);
+
+        for step in self.steps.iter() {
+            match step {
+                PathStep::Literal(literal) => path.push(literal),
+                PathStep::Render(item_index) => {
+                    items[*item_index]
+                        .render
+                        .draw(&mut path_part, values, index)?;
+                    path.push(path_part.as_str());
+                    path_part.clear();
+                }
+            }
+        }
+
+        Ok(path)
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use crate::types::{PathAttributes, Resolvers};
+
+    use super::*;
+
+    fn build_items(names: &[&str], index: &mut FieldIndex) -> Vec<PathItem> {
+        let mut items = Vec::new();
+
+        for (item_index, name) in names.iter().enumerate() {
+            let mut item = PathItem::new(name, &Resolvers::new(), index).unwrap();
+            item.parent = item_index.checked_sub(1);
+            items.push(item);
+        }
+
+        items
+    }
+
+    #[test]
+    fn test_path_program_new_joins_literals_success() {
+        let mut index = FieldIndex::new();
+        let items = build_items(&["/", "path", "to", "{thing}", "a", "b"], &mut index);
+
+        let program = PathProgram::new(&items, items.len() - 1);
+
+        assert_eq!(
+            program.steps,
+            vec![
+                PathStep::Literal("/path/to".into()),
+                PathStep::Render(3),
+                PathStep::Literal("a/b".into()),
+            ]
+        );
+    }
+
+    #[rstest::rstest]
+    #[case("value", "/path/to/value/a/b")]
+    #[case("/rooted", "/rooted/a/b")]
+    #[case("", "/path/to/a/b")]
+    fn test_path_program_draw_success(#[case] value: &str, #[case] expected: &str) {
+        let mut index = FieldIndex::new();
+        let items = build_items(&["/", "path", "to", "{thing}", "a", "b"], &mut index);
+        let fields = {
+            let mut fields = PathAttributes::new();
+            fields.insert("thing".try_into().unwrap(), value.into());
+            fields
+        };
+
+        let program = PathProgram::new(&items, items.len() - 1);
+        let path = program
+            .draw(&items, &index.values(&fields), &index)
+            .unwrap();
+
+        // The path must be the same as pushing every part one at a time.
+        let mut expected_path = std::path::PathBuf::new();
+        for item in items.iter() {
+            let mut part = String::new();
+            item.render
+                .draw(&mut part, &index.values(&fields), &index)
+                .unwrap();
+            expected_path.push(part);
+        }
+
+        assert_eq!(path, std::path::PathBuf::from(expected));
+        assert_eq!(path, expected_path);
+    }
+
+    #[test]
+    fn test_path_program_draw_failure_missing_field() {
+        let mut index = FieldIndex::new();
+        let items = build_items(&["/", "path", "{thing}"], &mut index);
+
+        let program = PathProgram::new(&items, items.len() - 1);
+        let result = program.draw(&items, &index.values(&PathAttributes::new()), &index);
+
+        assert!(result.is_err());
+    }
+}
@@ -0,0 +1,703 @@
+use crate::types::token::write_regex_literal;
+use crate::types::{FieldIndex, FieldValues, PathValue, Resolver, Resolvers, Token, Tokens};
+
+/// The number of characters to reserve for a field when the width of its value is unknown.
+const FIELD_CAPACITY_HINT: usize = 8;
+
+#[derive(Clone, Debug, PartialEq, Eq, Hash)]
+pub(crate) enum RenderOp {
+    Literal(String),
+    /// A field without a resolver, which accepts either a string or an unpadded integer.
+    Field(usize),
+    String(usize),
+    Integer {
+        id: usize,
+        padding: u8,
+    },
+}
+
+impl RenderOp {
+    fn new(id: usize, resolver: &Resolver) -> Self {
+        match resolver {
+            Resolver::Default => Self::Field(id),
+            Resolver::String { .. } => Self::String(id),
+            Resolver::Integer { padding } => Self::Integer {
+                id,
+                padding: *padding,
+            },
+        }
+    }
+
+    fn id(&self) -> Option<usize> {
+        match self {
+            Self::Literal(_) => None,
+            Self::Field(id) | Self::String(id) | Self::Integer { id, .. } => Some(*id),
+        }
+    }
+
+    fn capacity(&self) -> usize {
+        match self {
+            Self::Literal(literal) => literal.len(),
+            Self::Integer { padding, .. } => (*padding as usize).max(FIELD_CAPACITY_HINT),
+            Self::Field(_) | Self::String(_) => FIELD_CAPACITY_HINT,
+        }
+    }
+
+    fn draw(
+        &self,
+        buf: &mut impl std::fmt::Write,
+        values: &FieldValues,
+        index: &FieldIndex,
+    ) -> Result<(), crate::Error> {
+        let id = match self {
+            Self::Literal(literal) => {
+                return match buf.write_str(literal) {
+                    Ok(_) => Ok(()),
+                    Err(error) => Err(crate::Error::new(format!(
+                        "Error while formatting token: {error}"
+                    ))),
+                };
+            }
+            Self::Field(id) | Self::String(id) | Self::Integer { id, .. } => *id,
+        };
+        let value = match values[id] {
+            Some(value) => value,
+            None => {
+                return Err(crate::Error::new(format!(
+                    "Could not find {:?} in the fields.",
+                    index.key(id).as_str()
+                )));
+            }
+        };
+        let result = match (self, value) {
+            (Self::Field(_), PathValue::Integer(v)) => write!(buf, "{v}"),
+            (Self::Integer { padding, .. }, PathValue::Integer(v)) => {
+                write!(buf, "{:0width$}", v, width = *padding as usize)
+            }
+            (Self::Field(_) | Self::String(_), PathValue::String(v)) => buf.write_str(v),
+            _ => {
+                return Err(crate::Error::new(format!(
+                    "Resolver type {:?} is invalid for value {value:?}.",
+                    index.resolver(id)
+                )));
+            }
+        };
+
+        match result {
+            Ok(_) => Ok(()),
+            Err(error) => Err(crate::Error::new(format!(
+                "Error while formatting: {error}"
+            ))),
+        }
+    }
+
+    fn is_resolved_by(&self, values: &FieldValues) -> bool {
+        match self.id() {
+            Some(id) => values[id].is_some(),
+            None => true,
+        }
+    }
+
+    fn draw_regex_pattern(
+        &self,
+        buf: &mut impl std::fmt::Write,
+        values: &FieldValues,
+        index: &FieldIndex,
+    ) -> Result<(), crate::Error> {
+        match self {
+            Self::Literal(literal) => write_regex_literal(buf, literal)?,
+            _ if self.is_resolved_by(values) => {
+                let mut literal = String::with_capacity(self.capacity());
+                self.draw(&mut literal, values, index)?;
+                write_regex_literal(buf, &literal)?;
+            }
+            _ => {
+                if let Some(id) = self.id() {
+                    buf.write_char('(')?;
+                    buf.write_str(&index.resolver(id).pattern())?;
+                    buf.write_char(')')?;
+                }
+            }
+        };
+
+        Ok(())
+    }
+}
+
+/// A path part's tokens that have been bound to a config's field ids.
+///
+/// The tokens are parsed and bound once when the config is built, so drawing a path part is just
+/// a walk over the ops with the field values looked up by id.
+#[derive(Clone, Debug, PartialEq, Eq, Hash)]
+pub(crate) struct RenderProgram {
+    pub(crate) ops: Vec<RenderOp>,
+    capacity: usize,
+}
+
+impl RenderProgram {
+    pub(crate) fn new(tokens: &Tokens, index: &mut FieldIndex, resolvers: &Resolvers) -> Self {
+        let mut ops = Vec::with_capacity(tokens.tokens.len());
+
+        for token in tokens.tokens.iter() {
+            match token {
+                Token::Literal(literal) => ops.push(RenderOp::Literal(literal.clone())),
+                Token::Variable(variable) => {
+                    let id = index.intern(variable, resolvers);
+                    ops.push(RenderOp::new(id, index.resolver(id)))
+                }
+            }
+        }
+
+        let capacity = ops.iter().map(RenderOp::capacity).sum();
+
+        Self { ops, capacity }
+    }
+
+    /// The field id of the first op, if the path part starts with a field.
+    pub(crate) fn first_field(&self) -> Option<usize> {
+        self.ops.first().and_then(RenderOp::id)
+    }
+
+    /// The drawn path part, if the part does not have any fields.
+    pub(crate) fn literal(&self) -> Option<String> {
+        let mut literal = String::with_capacity(self.capacity);
+
+        for op in self.ops.iter() {
+            match op {
+                RenderOp::Literal(text) => literal.push_str(text),
+                _ => return None,
+            }
+        }
+
+        Some(literal)
+    }
+
+    /// An estimate of the length of the drawn path part, to size the buffers with.
+    pub(crate) fn capacity(&self) -> usize {
+        self.capacity
+    }
+
+    pub(crate) fn draw(
+        &self,
+        buf: &mut impl std::fmt::Write,
+        values: &FieldValues,
+        index: &FieldIndex,
+    ) -> Result<(), crate::Error> {
+        for op in self.ops.iter() {
+            op.draw(buf, values, index)?;
+        }
+        Ok(())
+    }
+
+    pub(crate) fn is_resolved_by(&self, values: &FieldValues) -> bool {
+        for op in self.ops.iter() {
+            if !op.is_resolved_by(values) {
+                return false;
+            }
+        }
+
+        true
+    }
+
+    /// Split the drawn path part into the directory levels it covers, and compile the regex for
+    /// each level with missing fields.
+    ///
+    /// The available field values are drawn where they are, and may contain separators, so one
+    /// path part can span several levels. The levels without missing fields are kept as text, so
+    /// they can be joined without reading the filesystem.
+    pub(crate) fn compile_regex_levels(
+        &self,
+        values: &FieldValues,
+        index: &FieldIndex,
+    ) -> Result<Vec<PartLevel>, crate::Error> {
+        let mut levels = Vec::new();
+        let mut level = PartLevelBuilder::new(self.capacity());
+        let mut text = String::with_capacity(self.capacity());
+
+        for op in self.ops.iter() {
+            if !op.is_resolved_by(values) {
+                op.draw_regex_pattern(&mut level.pattern, values, index)?;
+                level.has_missing_fields = true;
+                continue;
+            }
+
+            text.clear();
+            op.draw(&mut text, values, index)?;
+
+            for (piece_index, piece) in text.split(std::path::is_separator).enumerate() {
+                if piece_index > 0 {
+                    // A value that starts with a separator is rooted, so it replaces the path.
+                    if levels.is_empty() && level.is_empty() {
+                        levels.push(PartLevel::Literal(std::path::MAIN_SEPARATOR_STR.into()));
+                    }
+
+                    level.finish(&mut levels)?;
+                }
+
+                level.push_text(piece)?;
+            }
+        }
+
+        level.finish(&mut levels)?;
+
+        Ok(levels)
+    }
+}
+
+/// One directory level of a drawn path part.
+#[derive(Clone, Debug)]
+pub(crate) enum PartLevel {
+    /// The level does not have any missing fields.
+    Literal(String),
+    /// The level has missing fields, so it is matched against the directory entries.
+    Pattern(std::sync::Arc<regex::Regex>),
+}
+
+struct PartLevelBuilder {
+    text: String,
+    pattern: String,
+    has_missing_fields: bool,
+}
+
+impl PartLevelBuilder {
+    fn new(capacity: usize) -> Self {
+        let mut pattern = String::with_capacity(capacity + 2);
+        pattern.push('^');
+
+        Self {
+            text: String::with_capacity(capacity),
+            pattern,
+            has_missing_fields: false,
+        }
+    }
+
+    fn is_empty(&self) -> bool {
+        self.text.is_empty() && !self.has_missing_fields
+    }
+
+    fn push_text(&mut self, text: &str) -> Result<(), crate::Error> {
+        self.text.push_str(text);
+        write_regex_literal(&mut self.pattern, text)
+    }
+
+    /// Add the level to the levels, and start the next level.
+    ///
+    /// Empty levels, such as the ones around repeated separators, are skipped.
+    fn finish(&mut self, levels: &mut Vec<PartLevel>) -> Result<(), crate::Error> {
+        if self.has_missing_fields {
+            self.pattern.push('$');
+            levels.push(PartLevel::Pattern(crate::cache::regex(&self.pattern)?));
+        } else if !self.text.is_empty() {
+            levels.push(PartLevel::Literal(self.text.clone()));
+        }
+
+        self.text.clear();
+        self.pattern.truncate(1);
+        self.has_missing_fields = false;
+
+        Ok(())
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use crate::types::PathAttributes;
+
+    use super::*;
+
+    fn build_program(input: &str, resolvers: &Resolvers) -> (RenderProgram, FieldIndex) {
+        let mut index = FieldIndex::new();
+        let program = RenderProgram::new(&Tokens::new(&input).unwrap(), &mut index, resolvers);
+
+        (program, index)
+    }
+
+    #[rstest::rstest]
+    #[case("", "")]
+    #[case("test", "test")]
+    #[case("123", "123")]
+    fn test_render_op_draw_literal_success(#[case] input: &str, #[case] expected: &str) {
+        let op = RenderOp::Literal(input.to_string());
+
+        let mut result = String::new();
+        op.draw(&mut result, &FieldValues::new(), &FieldIndex::new())
+            .unwrap();
+
+        assert_eq!(result, expected);
+    }
+
+    #[test]
+    fn test_render_op_draw_literal_failure_cannot_write_into_buf() {
+        struct TestWriter;
+
+        impl std::fmt::Write for TestWriter {
+            fn write_str(&mut self, _text: &str) -> std::fmt::Result {
+                Err(std::fmt::Error)
+            }
+        }
+
+        let op = RenderOp::Literal("test".to_string());
+        let mut writer = TestWriter;
+        let err = op
+            .draw(&mut writer, &FieldValues::new(), &FieldIndex::new())
+            .unwrap_err();
+
+        assert_eq!(
+            err.to_string(),
+            "Error while formatting token: an error occurred when formatting an argument"
+        );
+    }
+
+    #[rstest::rstest]
+    #[case("{test_str}", "test")]
+    #[case("{test_str_default}", "test")]
+    #[case("{test_int_no_zpad}", "1")]
+    #[case("{test_int_with_zpad}", "001")]
+    fn test_render_op_draw_field_success(#[case] input: &str, #[case] expected: &str) {
+        let mut fields = PathAttributes::new();
+        fields.insert("test_str".try_into().unwrap(), "test".into());
+        fields.insert("test_str_default".try_into().unwrap(), "test".into());
+        fields.insert("test_int_no_zpad".try_into().unwrap(), 1u8.into());
+        fields.insert("test_int_with_zpad".try_into().unwrap(), 1u8.into());
+        let mut resolvers = Resolvers::new();
+        resolvers.insert(
+            "test_str".try_into().unwrap(),
+            Resolver::String { pattern: None },
+        );
+        resolvers.insert(
+            "test_int_no_zpad".try_into().unwrap(),
+            Resolver::Integer { padding: 0 },
+        );
+        resolvers.insert(
+            "test_int_with_zpad".try_into().unwrap(),
+            Resolver::Integer { padding: 3 },
+        );
+        let (program, index) = build_program(input, &resolvers);
+
+        let mut result = String::new();
+        program.ops[0]
+            .draw(&mut result, &index.values(&fields), &index)
+            .unwrap();
+
+        assert_eq!(result, expected);
+    }
+
+    #[test]
+    fn test_render_op_draw_field_failure_missing_field() {
+        let (program, index) = build_program("{test}", &Resolvers::new());
+        let mut writer = String::new();
+        let err = program.ops[0]
+            .draw(&mut writer, &index.values(&PathAttributes::new()), &index)
+            .unwrap_err();
+
+        assert_eq!(err.to_string(), "Could not find \"test\" in the fields.");
+    }
+
+    #[test]
+    fn test_render_op_draw_field_failure_int_resolver_mismatch() {
+        let fields = {
+            let mut fields = PathAttributes::new();
+            fields.insert("test".try_into().unwrap(), 1u8.into());
+            fields
+        };
+        let resolvers = {
+            let mut resolvers = Resolvers::new();
+            resolvers.insert(
+                "test".try_into().unwrap(),
+                Resolver::String { pattern: None },
+            );
+            resolvers
+        };
+        let (program, index) = build_program("{test}", &resolvers);
+        let mut writer = String::new();
+        let err = program.ops[0]
+            .draw(&mut writer, &index.values(&fields), &index)
+            .unwrap_err();
+
+        assert_eq!(
+            err.to_string(),
+            "Resolver type String { pattern: None } is invalid for value Integer(1)."
+        );
+    }
+
+    #[test]
+    fn test_render_op_draw_field_failure_str_resolver_mismatch() {
+        let fields = {
+            let mut fields = PathAttributes::new();
+            fields.insert("test".try_into().unwrap(), "test".into());
+            fields
+        };
+        let resolvers = {
+            let mut resolvers = Resolvers::new();
+            resolvers.insert("test".try_into().unwrap(), Resolver::Integer { padding: 1 });
+            resolvers
+        };
+        let (program, index) = build_program("{test}", &resolvers);
+        let mut writer = String::new();
+        let err = program.ops[0]
+            .draw(&mut writer, &index.values(&fields), &index)
+            .unwrap_err();
+
+        assert_eq!(
+            err.to_string(),
+            "Resolver type Integer { padding: 1 } is invalid for value String(\"test\")."
+        );
+    }
+
+    #[rstest::rstest]
+    #[case("{test_str}")]
+    #[case("{test_int}")]
+    fn test_render_op_draw_field_failure_write_err(#[case] input: &str) {
+        struct TestWriter;
+
+        impl std::fmt::Write for TestWriter {
+            fn write_str(&mut self, _text: &str) -> std::fmt::Result {
+                Err(std::fmt::Error)
+            }
+        }
+
+        let mut fields = PathAttributes::new();
+        fields.insert("test_str".try_into().unwrap(), "test".into());
+        fields.insert("test_int".try_into().unwrap(), 1u8.into());
+        let (program, index) = build_program(input, &Resolvers::new());
+        let mut writer = TestWriter;
+        let err = program.ops[0]
+            .draw(&mut writer, &index.values(&fields), &index)
+            .unwrap_err();
+
+        assert_eq!(
+            err.to_string(),
+            "Error while formatting: an error occurred when formatting an argument"
+        );
+    }
+
+    #[rstest::rstest]
+    #[case("", &[])]
+    #[case("abc", &[RenderOp::Literal("abc".to_string())])]
+    #[case("{abc}", &[RenderOp::Field(0)])]
+    #[case("abc{def}", &[RenderOp::Literal("abc".to_string()), RenderOp::Field(0)])]
+    #[case("{abc}def", &[RenderOp::Field(0), RenderOp::Literal("def".to_string())])]
+    #[case("{abc}{def}", &[RenderOp::Field(0), RenderOp::Field(1)])]
+    #[case("{abc}_{abc}", &[RenderOp::Field(0), RenderOp::Literal("_".to_string()), RenderOp::Field(0)])]
+    fn test_render_program_new_success(#[case] input: &str, #[case] expected: &[RenderOp]) {
+        let (program, _) = build_program(input, &Resolvers::new());
+
+        assert_eq!(program.ops, expected);
+    }
+
+    #[test]
+    fn test_render_program_new_binds_resolvers_success() {
+        let resolvers = {
+            let mut resolvers = Resolvers::new();
+            resolvers.insert(
+                "test_str".try_into().unwrap(),
+                Resolver::String { pattern: None },
+            );
+            resolvers.insert(
+                "test_int".try_into().unwrap(),
+                Resolver::Integer { padding: 3 },
+            );
+            resolvers
+        };
+        let (program, _) = build_program("{test_str}_{test_int}_{test_default}", &resolvers);
+
+        assert_eq!(
+            program.ops,
+            &[
+                RenderOp::String(0),
+                RenderOp::Literal("_".to_string()),
+                RenderOp::Integer { id: 1, padding: 3 },
+                RenderOp::Literal("_".to_string()),
+                RenderOp::Field(2),
+            ]
+        );
+    }
+
+    #[rstest::rstest]
+    #[case("", 0)]
+    #[case("abc", 3)]
+    #[case("abc_{test_str}", 4 + FIELD_CAPACITY_HINT)]
+    #[case("{test_int}", FIELD_CAPACITY_HINT)]
+    #[case("{test_wide_int}", 12)]
+    fn test_render_program_capacity_success(#[case] input: &str, #[case] expected: usize) {
+        let resolvers = {
+            let mut resolvers = Resolvers::new();
+            resolvers.insert(
+                "test_int".try_into().unwrap(),
+                Resolver::Integer { padding: 3 },
+            );
+            resolvers.insert(
+                "test_wide_int".try_into().unwrap(),
+                Resolver::Integer { padding: 12 },
+            );
+            resolvers
+        };
+        let (program, _) = build_program(input, &resolvers);
+
+        assert_eq!(program.capacity(), expected);
+    }
+
+    #[rstest::rstest]
+    #[case("", Some(""))]
+    #[case("abc", Some("abc"))]
+    #[case("abc_{test_str}", None)]
+    #[case("{test_str}", None)]
+    fn test_render_program_literal_success(#[case] input: &str, #[case] expected: Option<&str>) {
+        let (program, _) = build_program(input, &Resolvers::new());
+
+        assert_eq!(program.literal().as_deref(), expected);
+    }
+
+    #[rstest::rstest]
+    #[case("{test_str}", "test")]
+    #[case("{test_int}", "001")]
+    #[case("abc {test_str}", "abc test")]
+    #[case("abc {test_int}", "abc 001")]
+    #[case("{test_str} abc", "test abc")]
+    #[case("{test_int} abc", "001 abc")]
+    fn test_render_program_draw_success(#[case] input: &str, #[case] expected: &str) {
+        let fields = {
+            let mut fields = PathAttributes::new();
+            fields.insert("test_str".try_into().unwrap(), "test".into());
+            fields.insert("test_int".try_into().unwrap(), 1u8.into());
+            fields
+        };
+
+        let resolvers = {
+            let mut resolvers = Resolvers::new();
+            resolvers.insert(
+                "test_str".try_into().unwrap(),
+                Resolver::String { pattern: None },
+            );
+            resolvers.insert(
+                "test_int".try_into().unwrap(),
+                Resolver::Integer { padding: 3 },
+            );
+            resolvers
+        };
+        let (program, index) = build_program(input, &resolvers);
+
+        let mut result = String::new();
+        program
+            .draw(&mut result, &index.values(&fields), &index)
+            .unwrap();
+
+        assert_eq!(result, expected);
+    }
+
+    #[rstest::rstest]
+    #[case("{test_str}", "test_str")]
+    #[case("{test_int}", "test_int")]
+    #[case("abc {test_str}", "test_str")]
+    #[case("abc {test_int}", "test_int")]
+    #[case("{test_str} abc", "test_str")]
+    #[case("{test_int} abc", "test_int")]
+    fn test_render_program_draw_failure(#[case] input: &str, #[case] expected: &str) {
+        let (program, index) = build_program(input, &Resolvers::new());
+
+        let mut writer = String::new();
+        let result = program
+            .draw(&mut writer, &index.values(&PathAttributes::new()), &index)
+            .unwrap_err();
+
+        assert_eq!(
+            result.to_string(),
+            format!("Could not find {expected:?} in the fields.")
+        );
+    }
+
+    #[rstest::rstest]
+    #[case("abc", true)]
+    #[case("{test_str}", true)]
+    #[case("abc_{test_str}", true)]
+    #[case("{test_str}_{test_int}", false)]
+    #[case("{test_int}", false)]
+    fn test_render_program_is_resolved_by_success(#[case] input: &str, #[case] expected: bool) {
+        let fields = {
+            let mut fields = PathAttributes::new();
+            fields.insert("test_str".try_into().unwrap(), "test".into());
+            fields
+        };
+        let (program, index) = build_program(input, &Resolvers::new());
+
+        assert_eq!(program.is_resolved_by(&index.values(&fields)), expected);
+    }
+
+    #[rstest::rstest]
+    #[case("abc", &["abc"], true)]
+    #[case("abc", &["abcd"], false)]
+    #[case("a.c", &["abc"], false)]
+    #[case("{test_str}", &["test"], true)]
+    #[case("{test_str}", &["other"], false)]
+    #[case("{test_int}", &["001"], true)]
+    #[case("{test_int}", &["002"], false)]
+    #[case("{unresolved}", &["anything"], true)]
+    #[case("{test_str}_{unresolved}.txt", &["test_abc.txt"], true)]
+    #[case("{test_str}_{unresolved}.txt", &["other_abc.txt"], false)]
+    #[case("v{unresolved_int}", &["v01"], true)]
+    #[case("v{unresolved_int}", &["v1"], false)]
+    #[case("v{unresolved_int}", &["vab"], false)]
+    #[case("{test_path}_{unresolved}", &["x", "y_abc"], true)]
+    #[case("{test_path}_{unresolved}", &["x/y_abc"], false)]
+    #[case("{unresolved}_{test_path}", &["abc_x", "y"], true)]
+    #[case("{unresolved}_{test_path}_{unresolved}", &["abc_x", "y_abc"], true)]
+    #[case("{test_root}_{unresolved}", &["/", "x", "y_abc"], true)]
+    fn test_render_program_compile_regex_levels_success(
+        #[case] input: &str,
+        #[case] names: &[&str],
+        #[case] expected: bool,
+    ) {
+        let fields = {
+            let mut fields = PathAttributes::new();
+            fields.insert("test_str".try_into().unwrap(), "test".into());
+            fields.insert("test_int".try_into().unwrap(), 1u8.into());
+            fields.insert("test_path".try_into().unwrap(), "x/y".into());
+            fields.insert("test_root".try_into().unwrap(), "/x/y".into());
+            fields
+        };
+        let resolvers = {
+            let mut resolvers = Resolvers::new();
+            resolvers.insert(
+                "test_int".try_into().unwrap(),
+                Resolver::Integer { padding: 3 },
+            );
+            resolvers.insert(
+                "unresolved_int".try_into().unwrap(),
+                Resolver::Integer { padding: 2 },
+            );
+            resolvers
+        };
+        let (program, index) = build_program(input, &resolvers);
+
+        let levels = program
+            .compile_regex_levels(&index.values(&fields), &index)
+            .unwrap();
+        let is_match = levels.len() == names.len()
+            && levels.iter().zip(names).all(|(level, name)| match level {
+                PartLevel::Literal(literal) => {
+                    std::path::Path::new(literal) == std::path::Path::new(name)
+                }
+                PartLevel::Pattern(pattern) => pattern.is_match(name),
+            });
+
+        assert_eq!(is_match, expected);
+    }
+
+    #[test]
+    fn test_render_program_compile_regex_levels_literal_success() {
+        let fields = {
+            let mut fields = PathAttributes::new();
+            fields.insert("test_path".try_into().unwrap(), "x/y".into());
+            fields
+        };
+        let (program, index) = build_program("{test_path}_{unresolved}", &Resolvers::new());
+
+        let levels = program
+            .compile_regex_levels(&index.values(&fields), &index)
+            .unwrap();
+
+        // The leading level is only text, so it is joined without reading the filesystem.
+        assert!(matches!(&levels[0], PartLevel::Literal(literal) if literal == "x"));
+        assert!(matches!(&levels[1], PartLevel::Pattern(_)));
+    }
+}
@@ -30,7 +30,9 @@ impl Resolver {
                 Some(pattern) => pattern.to_string().into(),
                 None => ".+?".into(),
             },
-            Self::Integer { padding } => format!("\\d{{{},}}?", padding.max(&1)).into(),
+            // Only ASCII digits can be parsed into an integer, and the ASCII class is much smaller
+            // than the Unicode \d class.
+            Self::Integer { padding } => format!("[0-9]{{{},}}?", padding.max(&1)).into(),
         }
     }
 
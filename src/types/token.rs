@@ -1,4 +1,4 @@
-use crate::types::{FieldKey, PathAttributes, PathValue, Resolver, Resolvers};
+use crate::types::{FieldKey, Resolver, Resolvers};
 
 #[derive(Clone, Debug, PartialEq, Eq, Hash)]
 pub(crate) enum Token {
@@ -7,123 +7,13 @@ pub(crate) enum Token {
 }
 
 impl Token {
-    fn draw(
-        &self,
-        buf: &mut impl std::fmt::Write,
-        fields: &PathAttributes,
-        resolvers: &Resolvers,
-    ) -> Result<(), crate::Error> {
-        match self {
-            Self::Literal(literal) => match buf.write_str(literal) {
-                Ok(_) => Ok(()),
-                Err(error) => Err(crate::Error::new(format!(
-                    "Error while formatting token: {error}"
-                ))),
-            },
-            Self::Variable(variable) => {
-                let value = match fields.get(variable) {
-                    Some(value) => value,
-                    None => {
-                        return Err(crate::Error::new(format!(
-                            "Could not find {:?} in the fields.",
-                            variable.as_str()
-                        )));
-                    }
-                };
-                let resolver = match resolvers.get(variable) {
-                    Some(resolver) => resolver,
-                    None => &Resolver::Default,
-                };
-                match value {
-                    PathValue::Integer(v) => {
-                        let padding = match resolver {
-                            Resolver::Default => 0,
-                            Resolver::Integer { padding } => *padding,
-                            _ => {
-                                return Err(crate::Error::new(format!(
-                                    "Resolver type {resolver:?} is invalid for value {value:?}."
-                                )));
-                            }
-                        };
-                        match write!(buf, "{:0width$}", v, width = padding as usize) {
-                            Ok(_) => Ok(()),
-                            Err(error) => Err(crate::Error::new(format!(
-                                "Error while formatting: {error}"
-                            ))),
-                        }
-                    }
-                    PathValue::String(v) => {
-                        // Validate that the resolver type and the field type match
-                        match resolver {
-                            Resolver::Default | Resolver::String { .. } => (),
-                            _ => {
-                                return Err(crate::Error::new(format!(
-                                    "Resolver type {resolver:?} is invalid for value {value:?}."
-                                )));
-                            }
-                        };
-
-                        match buf.write_str(v) {
-                            Ok(_) => Ok(()),
-                            Err(error) => Err(crate::Error::new(format!(
-                                "Error while formatting: {error}"
-                            ))),
-                        }
-                    }
-                }
-            }
-        }
-    }
-
-    fn is_resolved_by(&self, fields: &PathAttributes) -> bool {
-        match self {
-            Self::Literal(_) => true,
-            Self::Variable(variable) => fields.get(variable).is_some(),
-        }
-    }
-
-    fn try_to_literal_token(
-        &self,
-        fields: &PathAttributes,
-        resolvers: &Resolvers,
-    ) -> Result<Self, crate::Error> {
-        match self {
-            Self::Literal(literal) => Ok(Self::Literal(literal.clone())),
-            Self::Variable(variable) => {
-                if fields.get(variable).is_none() {
-                    Ok(Self::Variable(variable.clone()))
-                } else {
-                    let mut buf = String::new();
-                    self.draw(&mut buf, fields, resolvers)?;
-                    Ok(Self::Literal(buf))
-                }
-            }
-        }
-    }
-
     fn draw_regex_pattern(
         &self,
         buf: &mut impl std::fmt::Write,
         resolvers: &Resolvers,
     ) -> Result<(), crate::Error> {
         match self {
-            Self::Literal(literal) => {
-                let mut escape_buf = String::new();
-
-                for character in literal.chars() {
-                    if character == '\\' || character == '/' {
-                        buf.write_str(&regex::escape(&escape_buf))?;
-                        escape_buf.clear();
-                        buf.write_str(r"[\\/]")?;
-                    } else {
-                        escape_buf.push(character);
-                    }
-                }
-
-                buf.write_str(&regex::escape(&escape_buf))?;
-
-                Ok(())
-            }
+            Self::Literal(literal) => write_regex_literal(buf, literal),
             Self::Variable(variable) => {
                 let resolver = match resolvers.get(variable) {
                     Some(resolver) => resolver,
@@ -136,23 +26,6 @@ impl Token {
             }
         }
     }
-
-    fn draw_glob_pattern(&self, buf: &mut impl std::fmt::Write) -> Result<(), crate::Error> {
-        match self {
-            Token::Literal(literal) => {
-                for character in literal.chars() {
-                    if character == '/' || character == '\\' {
-                        buf.write_char(std::path::MAIN_SEPARATOR)?;
-                    } else {
-                        buf.write_char(character)?;
-                    }
-                }
-            }
-            Token::Variable(_) => buf.write_char('*')?,
-        };
-
-        Ok(())
-    }
 }
 
 impl std::fmt::Display for Token {
@@ -178,42 +51,6 @@ impl Tokens {
         Ok(Self { tokens })
     }
 
-    pub(crate) fn draw(
-        &self,
-        buf: &mut impl std::fmt::Write,
-        fields: &PathAttributes,
-        resolvers: &Resolvers,
-    ) -> Result<(), crate::Error> {
-        for token in self.tokens.iter() {
-            token.draw(buf, fields, resolvers)?;
-        }
-        Ok(())
-    }
-
-    pub(crate) fn is_resolved_by(&self, fields: &PathAttributes) -> bool {
-        for token in self.tokens.iter() {
-            if !token.is_resolved_by(fields) {
-                return false;
-            }
-        }
-
-        true
-    }
-
-    pub(crate) fn try_to_literal_token(
-        &self,
-        fields: &PathAttributes,
-        resolvers: &Resolvers,
-    ) -> Result<Self, crate::Error> {
-        let mut tokens = Vec::new();
-
-        for token in self.tokens.iter() {
-            tokens.push(token.try_to_literal_token(fields, resolvers)?);
-        }
-
-        Ok(Self { tokens })
-    }
-
     pub(crate) fn draw_regex_pattern(
         &self,
         buf: &mut impl std::fmt::Write,
@@ -225,14 +62,16 @@ impl Tokens {
         Ok(())
     }
 
-    pub(crate) fn draw_glob_pattern(
+    pub(crate) fn compile_regex_pattern(
         &self,
-        buf: &mut impl std::fmt::Write,
-    ) -> Result<(), crate::Error> {
-        for token in self.tokens.iter() {
-            token.draw_glob_pattern(buf)?;
-        }
-        Ok(())
+        resolvers: &Resolvers,
+    ) -> Result<std::sync::Arc<regex::Regex>, crate::Error> {
+        let mut pattern = String::new();
+        pattern.push('^');
+        self.draw_regex_pattern(&mut pattern, resolvers)?;
+        pattern.push('$');
+
+        crate::cache::regex(&pattern)
     }
 
     pub(crate) fn has_variable_tokens(&self) -> bool {
@@ -350,164 +189,31 @@ impl TryFrom<&str> for Tokens {
     }
 }
 
-#[cfg(test)]
-mod tests {
-    use super::*;
-
-    #[rstest::rstest]
-    #[case("", "")]
-    #[case("test", "test")]
-    #[case("123", "123")]
-    fn test_token_draw_literal_success(#[case] input: &str, #[case] expected: &str) {
-        let token = Token::Literal(input.to_string());
-
-        let mut result = String::new();
-        token
-            .draw(&mut result, &PathAttributes::new(), &Resolvers::new())
-            .unwrap();
-
-        assert_eq!(result, expected);
-    }
-
-    #[test]
-    fn test_token_draw_literal_failure_cannot_write_into_buf() {
-        struct TestWriter;
-
-        impl std::fmt::Write for TestWriter {
-            fn write_str(&mut self, _text: &str) -> std::fmt::Result {
-                Err(std::fmt::Error)
-            }
+/// Write the literal as a regex pattern that matches either path separator.
+pub(crate) fn write_regex_literal(
+    buf: &mut impl std::fmt::Write,
+    literal: &str,
+) -> Result<(), crate::Error> {
+    let mut escape_buf = String::new();
+
+    for character in literal.chars() {
+        if character == '\\' || character == '/' {
+            buf.write_str(&regex::escape(&escape_buf))?;
+            escape_buf.clear();
+            buf.write_str(r"[\\/]")?;
+        } else {
+            escape_buf.push(character);
         }
-
-        let token = Token::Literal("test".to_string());
-        let mut writer = TestWriter;
-        let err = token
-            .draw(&mut writer, &PathAttributes::new(), &Resolvers::new())
-            .unwrap_err();
-
-        assert_eq!(
-            err.to_string(),
-            "Error while formatting token: an error occurred when formatting an argument"
-        );
-    }
-
-    #[rstest::rstest]
-    #[case("test_str", "test")]
-    #[case("test_str_default", "test")]
-    #[case("test_int_no_zpad", "1")]
-    #[case("test_int_with_zpad", "001")]
-    fn test_token_draw_variable_success(#[case] input: &str, #[case] expected: &str) {
-        let token = Token::Variable(input.try_into().unwrap());
-
-        let mut result = String::new();
-        let mut fields = PathAttributes::new();
-        fields.insert("test_str".try_into().unwrap(), "test".into());
-        fields.insert("test_str_default".try_into().unwrap(), "test".into());
-        fields.insert("test_int_no_zpad".try_into().unwrap(), 1u8.into());
-        fields.insert("test_int_with_zpad".try_into().unwrap(), 1u8.into());
-        let mut resolvers = Resolvers::new();
-        resolvers.insert(
-            "test_str".try_into().unwrap(),
-            Resolver::String { pattern: None },
-        );
-        resolvers.insert(
-            "test_int_no_zpad".try_into().unwrap(),
-            Resolver::Integer { padding: 0 },
-        );
-        resolvers.insert(
-            "test_int_with_zpad".try_into().unwrap(),
-            Resolver::Integer { padding: 3 },
-        );
-
-        token.draw(&mut result, &fields, &resolvers).unwrap();
-
-        assert_eq!(result, expected);
-    }
-
-    #[test]
-    fn test_token_draw_variable_failure_missing_field() {
-        let token = Token::Variable("test".try_into().unwrap());
-        let mut writer = String::new();
-        let err = token
-            .draw(&mut writer, &PathAttributes::new(), &Resolvers::new())
-            .unwrap_err();
-
-        assert_eq!(err.to_string(), "Could not find \"test\" in the fields.");
-    }
-
-    #[test]
-    fn test_token_draw_variable_failure_int_resolver_mismatch() {
-        let token = Token::Variable("test".try_into().unwrap());
-        let mut writer = String::new();
-        let fields = {
-            let mut fields = PathAttributes::new();
-            fields.insert("test".try_into().unwrap(), 1u8.into());
-            fields
-        };
-        let resolvers = {
-            let mut resolvers = Resolvers::new();
-            resolvers.insert(
-                "test".try_into().unwrap(),
-                Resolver::String { pattern: None },
-            );
-            resolvers
-        };
-        let err = token.draw(&mut writer, &fields, &resolvers).unwrap_err();
-
-        assert_eq!(
-            err.to_string(),
-            "Resolver type String { pattern: None } is invalid for value Integer(1)."
-        );
     }
 
-    #[test]
-    fn test_token_draw_variable_failure_str_resolver_mismatch() {
-        let token = Token::Variable("test".try_into().unwrap());
-        let mut writer = String::new();
-        let fields = {
-            let mut fields = PathAttributes::new();
-            fields.insert("test".try_into().unwrap(), "test".into());
-            fields
-        };
-        let resolvers = {
-            let mut resolvers = Resolvers::new();
-            resolvers.insert("test".try_into().unwrap(), Resolver::Integer { padding: 1 });
-            resolvers
-        };
-        let err = token.draw(&mut writer, &fields, &resolvers).unwrap_err();
-
-        assert_eq!(
-            err.to_string(),
-            "Resolver type Integer { padding: 1 } is invalid for value String(\"test\")."
-        );
-    }
+    buf.write_str(&regex::escape(&escape_buf))?;
 
-    #[rstest::rstest]
-    #[case("test_str")]
-    #[case("test_int")]
-    fn test_token_draw_variable_failure_write_err(#[case] input: &str) {
-        struct TestWriter;
-
-        impl std::fmt::Write for TestWriter {
-            fn write_str(&mut self, _text: &str) -> std::fmt::Result {
-                Err(std::fmt::Error)
-            }
-        }
+    Ok(())
+}
 
-        let mut fields = PathAttributes::new();
-        fields.insert("test_str".try_into().unwrap(), "test".into());
-        fields.insert("test_int".try_into().unwrap(), 1u8.into());
-        let token = Token::Variable(input.try_into().unwrap());
-        let mut writer = TestWriter;
-        let err = token
-            .draw(&mut writer, &fields, &Resolvers::new())
-            .unwrap_err();
-
-        assert_eq!(
-            err.to_string(),
-            "Error while formatting: an error occurred when formatting an argument"
-        );
-    }
+#[cfg(test)]
+mod tests {
+    use super::*;
 
     #[rstest::rstest]
     #[case("", ("", "", ""))]
@@ -584,27 +290,30 @@ mod tests {
     }
 
     #[rstest::rstest]
-    #[case("{test_str}", "test")]
-    #[case("{test_int}", "001")]
-    #[case("abc {test_str}", "abc test")]
-    #[case("abc {test_int}", "abc 001")]
-    #[case("{test_str} abc", "test abc")]
-    #[case("{test_int} abc", "001 abc")]
-    fn test_tokens_draw_success(#[case] input: &str, #[case] expected: &str) {
+    #[case("test", "test", true)]
+    #[case("test", "test_other", false)]
+    #[case("{test_str}", "abc", true)]
+    #[case("{test_str}", "abc_def", false)]
+    #[case("{test_int}", "001", true)]
+    #[case("{test_int}", "1234", true)]
+    #[case("{test_int}", "01", false)]
+    #[case("abc_{test_int}", "abc_001", true)]
+    #[case("abc_{test_int}", "xabc_001", false)]
+    #[case("{test_int}", "\u{661}\u{662}\u{663}", false)]
+    fn test_tokens_compile_regex_pattern_success(
+        #[case] input: &str,
+        #[case] path_part: &str,
+        #[case] expected: bool,
+    ) {
         let tokens = Tokens::new(&input).unwrap();
 
-        let fields = {
-            let mut fields = PathAttributes::new();
-            fields.insert("test_str".try_into().unwrap(), "test".into());
-            fields.insert("test_int".try_into().unwrap(), 1u8.into());
-            fields
-        };
-
         let resolvers = {
             let mut resolvers = Resolvers::new();
             resolvers.insert(
                 "test_str".try_into().unwrap(),
-                Resolver::String { pattern: None },
+                Resolver::String {
+                    pattern: Some(std::sync::Arc::new(regex::Regex::new("[a-z]+").unwrap())),
+                },
             );
             resolvers.insert(
                 "test_int".try_into().unwrap(),
@@ -613,31 +322,9 @@ mod tests {
             resolvers
         };
 
-        let mut result = String::new();
-        tokens.draw(&mut result, &fields, &resolvers).unwrap();
-
-        assert_eq!(result, expected);
-    }
-
-    #[rstest::rstest]
-    #[case("{test_str}", "test_str")]
-    #[case("{test_int}", "test_int")]
-    #[case("abc {test_str}", "test_str")]
-    #[case("abc {test_int}", "test_int")]
-    #[case("{test_str} abc", "test_str")]
-    #[case("{test_int} abc", "test_int")]
-    fn test_tokens_draw_failure(#[case] input: &str, #[case] expected: &str) {
-        let tokens = Tokens::new(&input).unwrap();
-
-        let mut writer = String::new();
-        let result = tokens
-            .draw(&mut writer, &PathAttributes::new(), &Resolvers::new())
-            .unwrap_err();
+        let pattern = tokens.compile_regex_pattern(&resolvers).unwrap();
 
-        assert_eq!(
-            result.to_string(),
-            format!("Could not find {expected:?} in the fields.")
-        );
+        assert_eq!(pattern.is_match(path_part), expected);
     }
 
     #[rstest::rstest]
@@ -107,13 +107,17 @@ pub async fn create_workspace<Func: CreateWorkspaceIoFunction + Send + Sync + 's
     template_fields: std::sync::Arc<crate::types::TemplateAttributes>,
     io_function: Func,
 ) -> Result<(), crate::Error> {
-    let resolved_items = get_workspace(config.as_ref(), path_fields)?;
-    let mut parent_resolved_map = std::collections::BTreeMap::new();
+    let resolved_items = get_shared_workspace(config.as_ref(), path_fields)?;
 
-    for resolved_item in &resolved_items {
-        let parent = resolved_item.value.parent();
-        parent_resolved_map
-            .entry(parent)
+    // Group the items by depth rather than by parent. A parent always has fewer components than
+    // its children, so every path at a given depth can be created at the same time once the
+    // previous depth is done, rather than one sibling group at a time.
+    let mut depth_resolved_map = std::collections::BTreeMap::new();
+
+    for resolved_item in resolved_items.iter() {
+        let depth = resolved_item.value.components().count();
+        depth_resolved_map
+            .entry(depth)
             .or_insert(Vec::new())
             .push(resolved_item.clone());
     }
@@ -121,8 +125,8 @@ pub async fn create_workspace<Func: CreateWorkspaceIoFunction + Send + Sync + 's
     let mut workers_set = tokio::task::JoinSet::new();
     let io_function = std::sync::Arc::new(io_function);
 
-    for (_, child_resolved_items) in parent_resolved_map {
-        for resolved_item in child_resolved_items {
+    for (_, depth_resolved_items) in depth_resolved_map {
+        for resolved_item in depth_resolved_items {
             let io_function = io_function.clone();
             let config = config.clone();
             let template_fields = template_fields.clone();
@@ -146,6 +150,9 @@ pub async fn create_workspace<Func: CreateWorkspaceIoFunction + Send + Sync + 's
 /// The only paths that will be returned are paths that can be fully resolved with the given path
 /// fields.
 ///
+/// The workspace is cached in the config, so calling this again with the same path fields
+/// copies the cached path items instead of resolving them again.
+///
 /// # Example
 ///
 /// ```rust
@@ -203,6 +210,25 @@ pub async fn create_workspace<Func: CreateWorkspaceIoFunction + Send + Sync + 's
 pub fn get_workspace(
     config: &crate::Config,
     path_fields: &crate::types::PathAttributes,
+) -> Result<Vec<crate::ResolvedPathItem>, crate::Error> {
+    Ok(get_shared_workspace(config, path_fields)?.to_vec())
+}
+
+/// Get the cached workspace for the path fields without copying it out of the cache.
+fn get_shared_workspace(
+    config: &crate::Config,
+    path_fields: &crate::types::PathAttributes,
+) -> Result<std::sync::Arc<[crate::ResolvedPathItem]>, crate::Error> {
+    let path_values = config.field_index.values(path_fields);
+
+    config
+        .workspace_cache
+        .get_or_try_insert_with(&path_values, || build_workspace(config, &path_values))
+}
+
+fn build_workspace(
+    config: &crate::Config,
+    path_values: &crate::types::FieldValues,
 ) -> Result<Vec<crate::ResolvedPathItem>, crate::Error> {
     let mut queue = std::collections::VecDeque::new();
     let mut parent_children_map = std::collections::HashMap::new();
@@ -220,7 +246,7 @@ pub fn get_workspace(
     fn is_deferred(
         config: &crate::Config,
         item: &crate::types::PathItem,
-        path_fields: &crate::types::PathAttributes,
+        path_values: &crate::types::FieldValues,
         index: usize,
         parent_children_map: &std::collections::HashMap<usize, Vec<usize>>,
         cache: &mut std::collections::HashMap<usize, bool>,
@@ -232,7 +258,7 @@ pub fn get_workspace(
         fn inner_is_deferred(
             config: &crate::Config,
             item: &crate::types::PathItem,
-            path_fields: &crate::types::PathAttributes,
+            path_values: &crate::types::FieldValues,
             index: usize,
             parent_children_map: &std::collections::HashMap<usize, Vec<usize>>,
             cache: &mut std::collections::HashMap<usize, bool>,
@@ -253,7 +279,7 @@ pub fn get_workspace(
                     let deferred = is_deferred(
                         config,
                         child_item,
-                        path_fields,
+                        path_values,
                         *child_index,
                         parent_children_map,
                         cache,
@@ -265,15 +291,17 @@ pub fn get_workspace(
                 }
             }
 
+            let deferred = config.item_attributes[index].deferred;
+
             if item.path.has_variable_tokens() {
-                item.deferred || !item.path.is_resolved_by(path_fields)
+                deferred || !item.render.is_resolved_by(path_values)
             } else {
-                item.deferred
+                deferred
             }
         }
 
         let result =
-            inner_is_deferred(config, item, path_fields, index, parent_children_map, cache);
+            inner_is_deferred(config, item, path_values, index, parent_children_map, cache);
         cache.insert(index, result);
 
         result
@@ -285,41 +313,42 @@ pub fn get_workspace(
         parent_resolved_item: &crate::ResolvedPathItem,
         item: &crate::types::PathItem,
         index: usize,
-        path_fields: &crate::types::PathAttributes,
+        path_values: &crate::types::FieldValues,
         parent_children_map: &std::collections::HashMap<usize, Vec<usize>>,
         index_key_map: &std::collections::HashMap<usize, crate::FieldKey>,
         resolved_items: &mut Vec<crate::ResolvedPathItem>,
         is_deferred_cache: &mut std::collections::HashMap<usize, bool>,
     ) -> Result<(), crate::Error> {
-        if !item.path.is_resolved_by(path_fields) {
+        if !item.render.is_resolved_by(path_values) {
             return Ok(());
         }
         let value = {
-            let mut path_part = String::new();
-            item.path
-                .draw(&mut path_part, path_fields, &config.resolvers)?;
+            let mut path_part = String::with_capacity(item.render.capacity());
+            item.render
+                .draw(&mut path_part, path_values, &config.field_index)?;
 
             parent_resolved_item.value.join(path_part)
         };
-        let permission = match item.permission {
+        let attributes = &config.item_attributes[index];
+        let permission = match attributes.permission {
             crate::types::Permission::Inherit => parent_resolved_item.permission,
-            _ => item.permission,
+            _ => attributes.permission,
         };
-        let owner = match item.owner {
+        let owner = match attributes.owner {
             crate::types::Owner::Inherit => parent_resolved_item.owner,
-            _ => item.owner,
+            _ => attributes.owner,
         };
-        let path_type = item.path_type;
+        let path_type = attributes.path_type;
         let key = index_key_map.get(&index).cloned();
         let deferred = is_deferred(
             config,
             item,
-            path_fields,
+            path_values,
             index,
             parent_children_map,
             is_deferred_cache,
         );
-        let metadata = item.metadata.clone();
+        let metadata = attributes.metadata.clone();
 
         let resolved_item = crate::ResolvedPathItem {
             key,
@@ -329,6 +358,7 @@ pub fn get_workspace(
             path_type,
             deferred,
             metadata,
+            parent_in_workspace: false,
         };
 
         let child_indexes = parent_children_map.get(&index);
@@ -341,7 +371,7 @@ pub fn get_workspace(
                     &resolved_item,
                     child_item,
                     *child_index,
-                    path_fields,
+                    path_values,
                     parent_children_map,
                     index_key_map,
                     resolved_items,
@@ -365,21 +395,23 @@ pub fn get_workspace(
 
     for (item, index) in queue.into_iter() {
         let key = index_key_map.get(&index).cloned();
+        let attributes = &config.item_attributes[index];
         let resolved_item = crate::ResolvedPathItem {
             key,
             value: std::path::PathBuf::new(),
-            permission: item.permission,
-            owner: item.owner,
-            path_type: item.path_type,
-            deferred: item.deferred,
-            metadata: item.metadata.clone(),
+            permission: attributes.permission,
+            owner: attributes.owner,
+            path_type: attributes.path_type,
+            deferred: attributes.deferred,
+            metadata: attributes.metadata.clone(),
+            parent_in_workspace: false,
         };
         recursive_build_items(
             config,
             &resolved_item,
             item,
             index,
-            path_fields,
+            path_values,
             &parent_children_map,
             &index_key_map,
             &mut resolved_items,
@@ -412,6 +444,27 @@ pub fn get_workspace(
         }
     }
 
+    let parent_in_workspace = {
+        let resolved_paths = filtered_resolved_items
+            .iter()
+            .map(|resolved_item| resolved_item.value.as_path())
+            .collect::<std::collections::HashSet<_>>();
+
+        filtered_resolved_items
+            .iter()
+            .map(|resolved_item| match resolved_item.value.parent() {
+                Some(parent) => resolved_paths.contains(parent),
+                None => false,
+            })
+            .collect::<Vec<_>>()
+    };
+
+    for (resolved_item, parent_in_workspace) in
+        filtered_resolved_items.iter_mut().zip(parent_in_workspace)
+    {
+        resolved_item.parent_in_workspace = parent_in_workspace;
+    }
+
     Ok(filtered_resolved_items)
 }
 
@@ -421,6 +474,95 @@ mod tests {
 
     use super::*;
 
+    #[test]
+    fn test_get_workspace_repeated_fields_success() {
+        let config = crate::ConfigBuilder::new()
+            .add_path_item(PathItemArgs {
+                key: "key".try_into().unwrap(),
+                path: "/path/to/{thing}".into(),
+                parent: None,
+                permission: Permission::default(),
+                owner: Owner::default(),
+                path_type: PathType::default(),
+                deferred: false,
+                metadata: std::collections::HashMap::new(),
+            })
+            .unwrap()
+            .build()
+            .unwrap();
+        let get_paths = |thing: &str, other: Option<&str>| {
+            let mut fields = crate::types::PathAttributes::new();
+            fields.insert("thing".try_into().unwrap(), thing.into());
+
+            if let Some(other) = other {
+                fields.insert("other".try_into().unwrap(), other.into());
+            }
+
+            get_workspace(&config, &fields)
+                .unwrap()
+                .into_iter()
+                .map(|resolved_item| resolved_item.value)
+                .collect::<Vec<_>>()
+        };
+
+        let paths = get_paths("value", None);
+
+        assert_eq!(paths.last().unwrap().to_str().unwrap(), "/path/to/value");
+        // The same fields, and fields that are not used by the config, resolve the same workspace.
+        assert_eq!(get_paths("value", None), paths);
+        assert_eq!(get_paths("value", Some("other")), paths);
+
+        let fields = {
+            let mut fields = crate::types::PathAttributes::new();
+            fields.insert("thing".try_into().unwrap(), "value".into());
+            fields
+        };
+        // A cached workspace is shared rather than copied.
+        assert!(std::sync::Arc::ptr_eq(
+            &get_shared_workspace(&config, &fields).unwrap(),
+            &get_shared_workspace(&config, &fields).unwrap()
+        ));
+        assert_eq!(
+            get_paths("other", None).last().unwrap().to_str().unwrap(),
+            "/path/to/other"
+        );
+    }
+
+    #[test]
+    fn test_get_workspace_metadata_shared_success() {
+        let config = crate::ConfigBuilder::new()
+            .add_path_item(PathItemArgs {
+                key: "key".try_into().unwrap(),
+                path: "/path/to/{thing}".into(),
+                parent: None,
+                permission: Permission::default(),
+                owner: Owner::default(),
+                path_type: PathType::default(),
+                deferred: false,
+                metadata: [("test".to_string(), crate::MetadataValue::Integer(123))]
+                    .into_iter()
+                    .collect(),
+            })
+            .unwrap()
+            .build()
+            .unwrap();
+        let get_item = |thing: &str| {
+            let mut fields = crate::types::PathAttributes::new();
+            fields.insert("thing".try_into().unwrap(), thing.into());
+
+            get_workspace(&config, &fields).unwrap().pop().unwrap()
+        };
+
+        let item = get_item("value");
+        let other_item = get_item("other");
+
+        assert_eq!(
+            item.metadata().get("test"),
+            Some(&crate::MetadataValue::Integer(123))
+        );
+        assert!(std::sync::Arc::ptr_eq(&item.metadata, &other_item.metadata));
+    }
+
     #[test]
     fn test_get_workspace_success() {
         let config = crate::ConfigBuilder::new()
@@ -644,6 +786,55 @@ mod tests {
         }
     }
 
+    #[test]
+    fn test_get_workspace_parent_in_workspace_success() {
+        let config = crate::ConfigBuilder::new()
+            .add_path_item(PathItemArgs {
+                key: "key".try_into().unwrap(),
+                path: "{root}/path/{thing}".into(),
+                parent: None,
+                permission: Permission::default(),
+                owner: Owner::default(),
+                path_type: PathType::default(),
+                deferred: false,
+                metadata: std::collections::HashMap::new(),
+            })
+            .unwrap()
+            .build()
+            .unwrap();
+
+        let fields = {
+            let mut fields = crate::types::PathAttributes::new();
+            fields.insert("root".try_into().unwrap(), "/root/dir".into());
+            fields.insert("thing".try_into().unwrap(), "value".into());
+
+            fields
+        };
+        let resolved_items = get_workspace(&config, &fields).unwrap();
+
+        let expected_results = [
+            ("/root/dir", false),
+            ("/root/dir/path", true),
+            ("/root/dir/path/value", true),
+        ];
+
+        assert_eq!(resolved_items.len(), expected_results.len());
+
+        for (resolved_item, expected) in resolved_items.iter().zip(expected_results) {
+            assert_eq!(
+                (
+                    resolved_item
+                        .value
+                        .to_string_lossy()
+                        .replace("\\", "/")
+                        .as_ref(),
+                    resolved_item.parent_in_workspace(),
+                ),
+                expected
+            );
+        }
+    }
+
     #[tokio::test]
     async fn test_create_workspace_success() {
         let config = crate::ConfigBuilder::new()
@@ -720,6 +911,87 @@ mod tests {
         .unwrap();
     }
 
+    #[tokio::test]
+    async fn test_create_workspace_parents_before_children_success() {
+        let tmp_dir = tempfile::tempdir().unwrap();
+        let root_dir = tmp_dir.path();
+
+        let config = crate::ConfigBuilder::new()
+            .add_path_item(PathItemArgs {
+                key: "root".try_into().unwrap(),
+                path: root_dir.to_path_buf(),
+                parent: None,
+                permission: Permission::default(),
+                owner: Owner::default(),
+                path_type: PathType::default(),
+                deferred: false,
+                metadata: std::collections::HashMap::new(),
+            })
+            .unwrap()
+            .add_path_item(PathItemArgs {
+                key: "key1".try_into().unwrap(),
+                path: "a/{thing}/b/c".into(),
+                parent: Some("root".try_into().unwrap()),
+                permission: Permission::default(),
+                owner: Owner::default(),
+                path_type: PathType::default(),
+                deferred: false,
+                metadata: std::collections::HashMap::new(),
+            })
+            .unwrap()
+            .add_path_item(PathItemArgs {
+                key: "key2".try_into().unwrap(),
+                path: "d/{thing}/e".into(),
+                parent: Some("root".try_into().unwrap()),
+                permission: Permission::default(),
+                owner: Owner::default(),
+                path_type: PathType::default(),
+                deferred: false,
+                metadata: std::collections::HashMap::new(),
+            })
+            .unwrap()
+            .build()
+            .unwrap();
+
+        let path_fields = {
+            let mut fields = crate::types::PathAttributes::new();
+            fields.insert("thing".try_into().unwrap(), "value".into());
+
+            fields
+        };
+
+        struct Func;
+
+        #[async_trait::async_trait]
+        impl CreateWorkspaceIoFunction for Func {
+            async fn call(
+                &self,
+                _config: std::sync::Arc<crate::Config>,
+                _template_fields: std::sync::Arc<crate::types::TemplateAttributes>,
+                path_item: crate::ResolvedPathItem,
+            ) -> Result<(), crate::Error> {
+                // Not creating the parents, so this fails if a child is created first.
+                match std::fs::create_dir(path_item.value()) {
+                    Ok(_) => Ok(()),
+                    Err(err) if err.kind() == std::io::ErrorKind::AlreadyExists => Ok(()),
+                    Err(err) => Err(err.into()),
+                }
+            }
+        }
+
+        create_workspace(
+            std::sync::Arc::new(config),
+            &path_fields,
+            std::sync::Arc::new(crate::types::TemplateAttributes::new()),
+            Func,
+        )
+        .await
+        .unwrap();
+
+        assert!(root_dir.join("a/value/b/c").is_dir());
+        assert!(root_dir.join("d/value/e").is_dir());
+    }
+
     #[tokio::test]
     async fn test_create_workspace_metadata_success() {
         let config = crate::ConfigBuilder::new()